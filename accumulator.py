@@ -0,0 +1,286 @@
+import int_backend
+from fraction_class import Fraction
+from complex import Complex
+from integer_scaling import as_fraction
+
+
+def _parts(value):
+    """
+    Гауссово целое с общим знаменателем для Complex или действительного числа.
+
+    :return: Кортеж (re, im, знаменатель) целых чисел.
+    """
+    if isinstance(value, Complex):
+        re, im = value.real, value.imag
+        if re.denominator == im.denominator:
+            return re.numerator, im.numerator, re.denominator
+        denominator = re.denominator * im.denominator // int_backend.gcd(re.denominator, im.denominator)
+        return (re.numerator * (denominator // re.denominator),
+                im.numerator * (denominator // im.denominator), denominator)
+    value = as_fraction(value)
+    return value.numerator, 0, value.denominator
+
+
+class FractionAccumulator:
+    """
+    Изменяемый накопитель суммы дробей.
+
+    Хранит несокращённые целые числитель и знаменатель и изменяет их на
+    месте, без создания промежуточных Fraction. Если знаменатель накопителя
+    делится на знаменатель слагаемого, он не растёт. Сокращение выполняется
+    раз в normalize_every операций, а неизменяемое значение создаётся только
+    методом value.
+
+    Атрибуты:
+        numerator (int): Несокращённый числитель.
+        denominator (int): Несокращённый положительный знаменатель.
+        normalize_every (int): Период сокращения.
+    """
+
+    __slots__ = ("numerator", "denominator", "_pending")
+
+    normalize_every = 64
+
+    def __init__(self, value=0):
+        """
+        :param value: Начальное значение (Fraction, int или float).
+        """
+        value = as_fraction(value)
+        self.numerator = value.numerator
+        self.denominator = value.denominator
+        self._pending = 0
+
+    def _add_raw(self, numerator, denominator):
+        """
+        Прибавление numerator/denominator (denominator > 0).
+        """
+        if self.denominator % denominator == 0:
+            self.numerator += numerator * (self.denominator // denominator)
+            return
+        self.numerator = self.numerator * denominator + numerator * self.denominator
+        self.denominator *= denominator
+        self._pending += 1
+        if self._pending >= self.normalize_every:
+            self.normalize()
+
+    def normalize(self):
+        """
+        Сокращение накопленной дроби на месте.
+
+        :return: self.
+        """
+        divisor = int_backend.gcd(self.numerator, self.denominator)
+        if divisor > 1:
+            self.numerator //= divisor
+            self.denominator //= divisor
+        self._pending = 0
+        return self
+
+    def __iadd__(self, other):
+        if isinstance(other, FractionAccumulator):
+            self._add_raw(other.numerator, other.denominator)
+            return self
+        other = as_fraction(other)
+        self._add_raw(other.numerator, other.denominator)
+        return self
+
+    def __isub__(self, other):
+        if isinstance(other, FractionAccumulator):
+            self._add_raw(-other.numerator, other.denominator)
+            return self
+        other = as_fraction(other)
+        self._add_raw(-other.numerator, other.denominator)
+        return self
+
+    def __imul__(self, other):
+        other = as_fraction(other)
+        self.numerator *= other.numerator
+        self.denominator *= other.denominator
+        self._pending += 1
+        if self._pending >= self.normalize_every:
+            self.normalize()
+        return self
+
+    def add_product(self, a, b):
+        """
+        Совмещённое умножение-сложение: acc += a * b без промежуточной дроби.
+
+        :param a: Fraction, int или float.
+        :param b: Fraction, int или float.
+        :return: self.
+        """
+        a, b = as_fraction(a), as_fraction(b)
+        self._add_raw(a.numerator * b.numerator, a.denominator * b.denominator)
+        return self
+
+    def sub_product(self, a, b):
+        """
+        Совмещённое умножение-вычитание: acc -= a * b.
+
+        :return: self.
+        """
+        a, b = as_fraction(a), as_fraction(b)
+        self._add_raw(-a.numerator * b.numerator, a.denominator * b.denominator)
+        return self
+
+    def add_cross(self, a, b, c, d):
+        """
+        Прибавление перекрёстного произведения: acc += a * b - c * d.
+
+        :return: self.
+        """
+        a, b, c, d = as_fraction(a), as_fraction(b), as_fraction(c), as_fraction(d)
+        left = a.denominator * b.denominator
+        right = c.denominator * d.denominator
+        if left == right:
+            self._add_raw(a.numerator * b.numerator - c.numerator * d.numerator, left)
+        else:
+            self._add_raw(a.numerator * b.numerator * right - c.numerator * d.numerator * left, left * right)
+        return self
+
+    def value(self):
+        """
+        Неизменяемое значение накопителя.
+
+        :return: Новая дробь.
+        """
+        return Fraction(self.numerator, self.denominator)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.value()!r})"
+
+
+class ComplexAccumulator:
+    """
+    Изменяемый накопитель комплексной суммы и произведения.
+
+    Хранит гауссово целое (re, im) с общим несокращённым знаменателем и
+    изменяет его на месте: умножение — четыре целых произведения без
+    промежуточных Fraction и без проверок в сеттерах Complex. Значение Complex
+    создаётся только методом value.
+
+    Атрибуты:
+        re (int): Числитель действительной части.
+        im (int): Числитель мнимой части.
+        denominator (int): Общий положительный знаменатель.
+        normalize_every (int): Период сокращения.
+    """
+
+    __slots__ = ("re", "im", "denominator", "_pending")
+
+    normalize_every = 64
+
+    def __init__(self, value=0):
+        """
+        :param value: Начальное значение (Complex, Fraction, int или float).
+        """
+        self.re, self.im, self.denominator = _parts(value)
+        self._pending = 0
+
+    def _add_raw(self, re, im, denominator):
+        """
+        Прибавление (re + i im) / denominator (denominator > 0).
+        """
+        if self.denominator % denominator == 0:
+            scale = self.denominator // denominator
+            self.re += re * scale
+            self.im += im * scale
+            return
+        self.re = self.re * denominator + re * self.denominator
+        self.im = self.im * denominator + im * self.denominator
+        self.denominator *= denominator
+        self._pending += 1
+        if self._pending >= self.normalize_every:
+            self.normalize()
+
+    def normalize(self):
+        """
+        Сокращение числителей и знаменателя на общий НОД на месте.
+
+        :return: self.
+        """
+        divisor = int_backend.gcd(int_backend.gcd(self.re, self.im), self.denominator)
+        if divisor > 1:
+            self.re //= divisor
+            self.im //= divisor
+            self.denominator //= divisor
+        self._pending = 0
+        return self
+
+    def __iadd__(self, other):
+        if isinstance(other, ComplexAccumulator):
+            self._add_raw(other.re, other.im, other.denominator)
+        else:
+            self._add_raw(*_parts(other))
+        return self
+
+    def __isub__(self, other):
+        if isinstance(other, ComplexAccumulator):
+            re, im, denominator = other.re, other.im, other.denominator
+        else:
+            re, im, denominator = _parts(other)
+        self._add_raw(-re, -im, denominator)
+        return self
+
+    def __imul__(self, other):
+        re, im, denominator = _parts(other)
+        self.re, self.im = self.re * re - self.im * im, self.re * im + self.im * re
+        self.denominator *= denominator
+        self._pending += 1
+        if self._pending >= self.normalize_every:
+            self.normalize()
+        return self
+
+    def add_product(self, a, b):
+        """
+        Совмещённое умножение-сложение: acc += a * b без промежуточного Complex.
+
+        :param a: Complex, Fraction, int или float.
+        :param b: Complex, Fraction, int или float.
+        :return: self.
+        """
+        a_re, a_im, a_den = _parts(a)
+        b_re, b_im, b_den = _parts(b)
+        self._add_raw(a_re * b_re - a_im * b_im, a_re * b_im + a_im * b_re, a_den * b_den)
+        return self
+
+    def sub_product(self, a, b):
+        """
+        Совмещённое умножение-вычитание: acc -= a * b.
+
+        :return: self.
+        """
+        a_re, a_im, a_den = _parts(a)
+        b_re, b_im, b_den = _parts(b)
+        self._add_raw(a_im * b_im - a_re * b_re, -(a_re * b_im + a_im * b_re), a_den * b_den)
+        return self
+
+    def add_cross(self, a, b, c, d):
+        """
+        Прибавление перекрёстного произведения: acc += a * b - c * d.
+
+        :return: self.
+        """
+        a_re, a_im, a_den = _parts(a)
+        b_re, b_im, b_den = _parts(b)
+        c_re, c_im, c_den = _parts(c)
+        d_re, d_im, d_den = _parts(d)
+        left, right = a_den * b_den, c_den * d_den
+        left_re, left_im = a_re * b_re - a_im * b_im, a_re * b_im + a_im * b_re
+        right_re, right_im = c_re * d_re - c_im * d_im, c_re * d_im + c_im * d_re
+        if left == right:
+            self._add_raw(left_re - right_re, left_im - right_im, left)
+        else:
+            self._add_raw(left_re * right - right_re * left, left_im * right - right_im * left, left * right)
+        return self
+
+    def value(self):
+        """
+        Неизменяемое значение накопителя.
+
+        :return: Новое комплексное число.
+        """
+        return Complex(Fraction(self.re, self.denominator), Fraction(self.im, self.denominator))
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.value()!r})"
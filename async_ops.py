@@ -0,0 +1,173 @@
+import asyncio
+from itertools import islice
+from fraction_class import Fraction
+from complex import Complex
+from integer_scaling import as_fraction
+
+
+def _power_steps(base, n):
+    """
+    Возведение Fraction или Complex в целую степень бинарным методом.
+
+    Генератор уступает (yield) после каждого умножения и возведения в
+    квадрат; результат возвращается как значение StopIteration.
+    """
+    result = Complex(1) if isinstance(base, Complex) else Fraction(1)
+    exponent = abs(n)
+    while exponent:
+        if exponent & 1:
+            result = result * base
+            yield
+        exponent >>= 1
+        if exponent:
+            base = base * base
+            yield
+    if n < 0:
+        return (Complex(1) if isinstance(result, Complex) else Fraction(1)) / result
+    return result
+
+
+def _power(base, n):
+    """
+    Возведение Fraction или Complex в целую степень без уступок.
+    """
+    steps = _power_steps(base, n)
+    while True:
+        try:
+            next(steps)
+        except StopIteration as stop:
+            return stop.value
+
+
+def _coerce(value):
+    """
+    Приведение слагаемого к Fraction, если оно не является Complex.
+    """
+    return value if value is None or isinstance(value, Complex) else as_fraction(value)
+
+
+def _sum_chunk(values, start=None):
+    """
+    Сумма порции значений без изменения исходных объектов.
+
+    Действительные значения приводятся к Fraction, а при смешивании с
+    Complex — к Complex, так как у Fraction и Complex нет __radd__.
+    """
+    total = _coerce(start)
+    for value in values:
+        value = _coerce(value)
+        if total is None:
+            total = value
+            continue
+        if isinstance(total, Complex):
+            if not isinstance(value, Complex):
+                value = Complex(value)
+        elif isinstance(value, Complex):
+            total = Complex(total)
+        total = total + value
+    return total
+
+
+def _map_chunk(function, arguments):
+    """
+    Применение функции к порции кортежей аргументов.
+    """
+    return [function(*args) for args in arguments]
+
+
+def _chunks(iterable, chunk_size):
+    """
+    Разбиение итерируемого объекта на списки длины chunk_size.
+    """
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+async def apow(base, n, chunk_size=1, executor=None):
+    """
+    Асинхронное возведение в целую степень.
+
+    Управление возвращается циклу событий после каждых chunk_size операций
+    бинарного возведения (умножений и возведений в квадрат). Число операций
+    не больше 2 * log2(n), а стоимость каждой растёт с размером чисел,
+    поэтому по умолчанию уступка выполняется после каждой операции. Если
+    задан executor, вычисление целиком выполняется в нём (потоки или процессы).
+
+    :param base: Основание (Complex или Fraction).
+    :param n: Степень (целое число).
+    :param chunk_size: Количество операций между уступками циклу событий.
+    :param executor: Необязательный concurrent.futures.Executor.
+    :return: base ** n.
+    :raises TypeError: Если n не является целым числом.
+    """
+    if not isinstance(n, int):
+        raise TypeError("Степень должна быть целым числом.")
+    if executor is not None:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, _power, base, n)
+
+    steps = _power_steps(base, n)
+    count = 0
+    while True:
+        try:
+            next(steps)
+        except StopIteration as stop:
+            return stop.value
+        count += 1
+        if count % chunk_size == 0:
+            await asyncio.sleep(0)
+
+
+async def asum(values, start=None, chunk_size=1024, executor=None):
+    """
+    Асинхронная сумма последовательности Fraction или Complex.
+
+    Значения суммируются порциями по chunk_size элементов, между порциями
+    управление возвращается циклу событий. Если задан executor, порции
+    суммируются в нём, а частичные суммы складываются в цикле событий.
+
+    :param values: Итерируемый объект с Fraction, Complex, int или float.
+    :param start: Начальное значение суммы (Fraction, Complex, int или float).
+    :param chunk_size: Размер порции.
+    :param executor: Необязательный concurrent.futures.Executor.
+    :return: Сумма значений (Fraction(0) для пустой последовательности).
+    """
+    loop = asyncio.get_running_loop()
+    total = _coerce(start)
+    for chunk in _chunks(values, chunk_size):
+        if executor is not None:
+            partial = await loop.run_in_executor(executor, _sum_chunk, chunk)
+            total = _sum_chunk([partial], total)
+        else:
+            total = _sum_chunk(chunk, total)
+            await asyncio.sleep(0)
+    return Fraction(0) if total is None else total
+
+
+async def amap(function, *iterables, chunk_size=1024, executor=None):
+    """
+    Асинхронное поэлементное применение функции к последовательностям.
+
+    Работает как map над несколькими последовательностями (например,
+    amap(operator.mul, a, b) для поэлементного произведения), обрабатывая
+    элементы порциями и уступая циклу событий между ними.
+
+    :param function: Функция (для процессного executor — сериализуемая pickle).
+    :param iterables: Последовательности аргументов.
+    :param chunk_size: Размер порции.
+    :param executor: Необязательный concurrent.futures.Executor.
+    :return: Список результатов.
+    """
+    loop = asyncio.get_running_loop()
+    result = []
+    for chunk in _chunks(zip(*iterables), chunk_size):
+        if executor is not None:
+            result.extend(await loop.run_in_executor(executor, _map_chunk, function, chunk))
+        else:
+            result.extend(_map_chunk(function, chunk))
+            await asyncio.sleep(0)
+    return result
@@ -0,0 +1,282 @@
+import argparse
+import ast
+import re
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from decimal import Decimal, InvalidOperation
+from itertools import islice
+from fraction_class import Fraction
+from complex import Complex
+
+# Наибольшая разрядность (в битах) числителей и знаменателей литералов и
+# промежуточных результатов: защита от неограниченного роста чисел.
+MAX_RESULT_BITS = 1 << 20
+
+# Оценка сверху количества битов на одну десятичную цифру.
+_BITS_PER_DIGIT = 3.33
+
+FORMATS = ("exact", "decimal", "float")
+
+# Мнимая единица записывается как i (3i, 2.5i) и переводится в синтаксис Python (3j).
+_IMAGINARY_LITERAL = re.compile(r"(\d[\d_]*\.?[\d_]*(?:[eE][+-]?\d+)?|\.\d[\d_]*(?:[eE][+-]?\d+)?)i\b")
+
+
+def _exact_literal(text):
+    """
+    Точная дробь, равная десятичной записи литерала.
+    """
+    try:
+        value = Decimal(text)
+    except InvalidOperation:
+        raise ValueError(f"Неверный числовой литерал: {text!r}.") from None
+    sign, digits, exponent = value.as_tuple()
+    if (len(digits) + abs(exponent)) * _BITS_PER_DIGIT > MAX_RESULT_BITS:
+        raise ValueError(f"Слишком большой литерал: {text!r}.")
+    return Fraction(*value.as_integer_ratio())
+
+
+def _bit_size(value):
+    """
+    Наибольшая разрядность числителей и знаменателей Fraction или Complex.
+    """
+    parts = (value.real, value.imag) if isinstance(value, Complex) else (value,)
+    return max(max(part.numerator.bit_length(), part.denominator.bit_length()) for part in parts)
+
+
+def _check_size(value):
+    """
+    :raises ValueError: Если разрядность значения превышает MAX_RESULT_BITS.
+    """
+    if _bit_size(value) > MAX_RESULT_BITS:
+        raise ValueError("Слишком большой промежуточный результат.")
+    return value
+
+
+def _promote(left, right):
+    """
+    Приведение операндов к общему типу: Complex, если хотя бы один комплексный.
+    """
+    if isinstance(left, Complex) or isinstance(right, Complex):
+        return (left if isinstance(left, Complex) else Complex(left),
+                right if isinstance(right, Complex) else Complex(right))
+    return left, right
+
+
+def _power(base, exponent):
+    """
+    Возведение в степень с проверкой показателя.
+    """
+    if isinstance(exponent, Complex):
+        if not exponent.is_real():
+            raise ValueError("Комплексная степень не поддерживается.")
+        exponent = exponent.real
+    # Разрядность результата не больше разрядности основания, умноженной на |p / q|
+    if _bit_size(base) * abs(exponent.numerator) > MAX_RESULT_BITS * exponent.denominator:
+        raise ValueError("Слишком большая степень.")
+    if isinstance(base, Complex):
+        if exponent.denominator != 1:
+            raise ValueError("Комплексное число можно возводить только в целую степень.")
+        return base ** int(exponent.numerator)
+    return base ** exponent
+
+
+def _evaluate_node(node, source):
+    """
+    Рекурсивное вычисление узла синтаксического дерева.
+    """
+    if isinstance(node, ast.Expression):
+        return _evaluate_node(node.body, source)
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float, complex):
+        if type(node.value) is int:
+            return Fraction(node.value)
+        text = ast.get_source_segment(source, node)
+        if type(node.value) is complex:
+            return Complex(0, _exact_literal(text[:-1]))
+        return _exact_literal(text)
+    if isinstance(node, ast.Name) and node.id in ("i", "j"):
+        return Complex(0, 1)
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+        operand = _evaluate_node(node.operand, source)
+        return -operand if isinstance(node.op, ast.USub) else operand
+    if isinstance(node, ast.BinOp):
+        left = _evaluate_node(node.left, source)
+        right = _evaluate_node(node.right, source)
+        if isinstance(node.op, ast.Pow):
+            return _check_size(_power(left, right))
+        left, right = _promote(left, right)
+        if isinstance(node.op, ast.Add):
+            return _check_size(left + right)
+        if isinstance(node.op, ast.Sub):
+            return _check_size(left - right)
+        if isinstance(node.op, ast.Mult):
+            return _check_size(left * right)
+        if isinstance(node.op, ast.Div):
+            return _check_size(left / right)
+    raise ValueError(f"Недопустимое выражение: {ast.get_source_segment(source, node)!r}.")
+
+
+def evaluate(expression):
+    """
+    Точное вычисление арифметического выражения.
+
+    Поддерживаются целые, десятичные и мнимые (3i или 3j) литералы, мнимая
+    единица i, скобки и операции +, -, *, /, **. Десятичные литералы
+    переводятся в дроби точно (0.1 == 1/10).
+
+    :param expression: Строка с выражением.
+    :return: Fraction или Complex (если результат не действительный).
+    :raises ValueError: Если выражение содержит недопустимые конструкции или литералы.
+    :raises ZeroDivisionError: При делении на ноль.
+    """
+    source = _IMAGINARY_LITERAL.sub(r"\1j", expression.strip())
+    try:
+        tree = ast.parse(source, mode="eval")
+    except SyntaxError:
+        raise ValueError(f"Синтаксическая ошибка: {expression.strip()!r}.") from None
+    result = _evaluate_node(tree, source)
+    if isinstance(result, Complex) and result.is_real():
+        return result.real
+    return result
+
+
+def _join_complex(real_text, imag_text):
+    """
+    Запись "a + bi" или "a - bi" по строкам частей.
+    """
+    if imag_text.startswith("-"):
+        return f"{real_text} - {imag_text[1:]}i"
+    return f"{real_text} + {imag_text}i"
+
+
+def format_value(value, output_format="exact", digits=20):
+    """
+    Форматирование результата.
+
+    :param value: Fraction или Complex.
+    :param output_format: "exact" (дробь), "decimal" (digits знаков после запятой) или "float".
+    :param digits: Количество знаков для формата "decimal".
+    :return: Строка.
+    :raises ValueError: Если формат неизвестен.
+    """
+    if output_format == "exact":
+        render = str
+    elif output_format == "decimal":
+        def render(part):
+            return part.to_decimal(digits)
+    elif output_format == "float":
+        def render(part):
+            return repr(float(part))
+    else:
+        raise ValueError(f"Неизвестный формат: {output_format!r}.")
+    if isinstance(value, Complex):
+        return _join_complex(render(value.real), render(value.imag))
+    return render(value)
+
+
+def _evaluate_chunk(lines, output_format, digits):
+    """
+    Вычисление порции строк; возвращает список (строка результата, признак ошибки).
+    """
+    results = []
+    for line in lines:
+        if not line.strip():
+            results.append(("", False))
+            continue
+        try:
+            results.append((format_value(evaluate(line), output_format, digits), False))
+        except (ValueError, ZeroDivisionError, TypeError, RecursionError) as error:
+            results.append((f"error: {error}", True))
+    return results
+
+
+def evaluate_lines(lines, output_format="exact", digits=20, jobs=1, chunk_size=10000):
+    """
+    Потоковое вычисление последовательности строк с сохранением порядка.
+
+    Строки читаются порциями по chunk_size. При jobs > 1 порции вычисляются
+    в пуле процессов, при этом в работе одновременно находится не более
+    2 * jobs порций, так что вход любого размера не загружается в память целиком.
+
+    :param lines: Итерируемый объект строк (например, открытый файл).
+    :param output_format: Формат вывода (см. format_value).
+    :param digits: Количество знаков для формата "decimal".
+    :param jobs: Количество процессов.
+    :param chunk_size: Количество строк в порции.
+    :return: Генератор пар (строка результата, признак ошибки).
+    """
+    iterator = iter(lines)
+    chunks = iter(lambda: list(islice(iterator, chunk_size)), [])
+    if jobs <= 1:
+        for chunk in chunks:
+            yield from _evaluate_chunk(chunk, output_format, digits)
+        return
+    with ProcessPoolExecutor(jobs) as executor:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(_evaluate_chunk, chunk, output_format, digits))
+            if len(pending) >= 2 * jobs:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def _parse_arguments(argv):
+    parser = argparse.ArgumentParser(
+        prog="python -m batch_eval",
+        description="Точное вычисление выражений с дробями и комплексными числами, по одному на строку.",
+    )
+    parser.add_argument("input", nargs="?", default="-", help="входной файл (по умолчанию stdin)")
+    parser.add_argument("-o", "--output", default="-", help="выходной файл (по умолчанию stdout)")
+    parser.add_argument("--format", choices=FORMATS, default="exact", dest="output_format",
+                        help="формат результата")
+    parser.add_argument("--digits", type=int, default=20, help="знаков после запятой для --format decimal")
+    parser.add_argument("--jobs", type=int, default=1, help="количество процессов")
+    parser.add_argument("--chunk-size", type=int, default=10000, help="строк в порции")
+    parser.add_argument("--stats", action="store_true", help="вывести сводку времени в stderr")
+    arguments = parser.parse_args(argv)
+    if arguments.digits < 0 or arguments.jobs < 1 or arguments.chunk_size < 1:
+        parser.error("--digits не может быть отрицательным, --jobs и --chunk-size должны быть положительными")
+    return arguments
+
+
+def main(argv=None):
+    """
+    Точка входа командной строки.
+
+    Каждая строка входа вычисляется функцией evaluate, результат выводится в
+    отдельной строке выхода; пустые строки сохраняются, ошибки выводятся как
+    "error: <сообщение>". Пример:
+
+        python -m batch_eval input.txt -o output.txt --format decimal --digits 30 --jobs 4 --stats
+
+    :param argv: Список аргументов (по умолчанию sys.argv[1:]).
+    :return: Код завершения: 0 или 1, если хотя бы одна строка содержала ошибку.
+    """
+    arguments = _parse_arguments(argv)
+    source = sys.stdin if arguments.input == "-" else open(arguments.input, encoding="utf-8")
+    target = sys.stdout if arguments.output == "-" else open(arguments.output, "w", encoding="utf-8")
+    start = time.perf_counter()
+    count = errors = 0
+    try:
+        for text, failed in evaluate_lines(source, arguments.output_format, arguments.digits,
+                                           arguments.jobs, arguments.chunk_size):
+            target.write(text + "\n")
+            count += 1
+            errors += failed
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if target is not sys.stdout:
+            target.close()
+    if arguments.stats:
+        elapsed = time.perf_counter() - start
+        rate = count / elapsed if elapsed else float("inf")
+        print(f"lines: {count}, errors: {errors}, time: {elapsed:.3f} s, {rate:.0f} lines/s",
+              file=sys.stderr)
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
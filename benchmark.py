@@ -0,0 +1,67 @@
+"""
+Сравнение бэкендов длинной арифметики для Fraction.
+
+Для каждого доступного бэкенда измеряется время сложения и умножения дробей
+с числителями и знаменателями заданной длины и выводится точка, начиная с
+которой альтернативный бэкенд быстрее встроенного int.
+
+Запуск: python benchmark.py
+"""
+import random
+import timeit
+import int_backend
+from fraction_class import Fraction
+
+DIGITS = (10, 100, 300, 1000, 3000, 10000, 30000)
+
+
+def measure(digits, repeat=5):
+    """
+    Время одной операции сложения и умножения (в микросекундах).
+
+    :param digits: Количество десятичных цифр числителя и знаменателя.
+    :param repeat: Количество повторов измерения.
+    :return: Кортеж (время сложения, время умножения).
+    """
+    rng = random.Random(digits)
+    bound = 10 ** digits
+    a = Fraction(rng.randrange(bound), rng.randrange(1, bound))
+    b = Fraction(rng.randrange(bound), rng.randrange(1, bound))
+    number = max(1, 20000 // digits)
+    add = min(timeit.repeat(lambda: a + b, number=number, repeat=repeat)) / number
+    mul = min(timeit.repeat(lambda: a * b, number=number, repeat=repeat)) / number
+    return add * 1e6, mul * 1e6
+
+
+def main():
+    """
+    Печать таблицы времени и точки перехода.
+    """
+    original = int_backend.get_backend()
+    results = {}
+    try:
+        for backend in int_backend.available_backends():
+            int_backend.set_backend(backend)
+            results[backend] = {digits: measure(digits) for digits in DIGITS}
+    finally:
+        int_backend.set_backend(original)
+
+    print(f"{'цифр':>8}" + "".join(f"{name + ' +':>14}{name + ' *':>14}" for name in results))
+    for digits in DIGITS:
+        row = "".join(f"{add:14.1f}{mul:14.1f}" for add, mul in (results[name][digits] for name in results))
+        print(f"{digits:>8}{row}")
+
+    for backend in results:
+        if backend == "int":
+            continue
+        crossover = next((d for d in DIGITS if sum(results[backend][d]) < sum(results["int"][d])), None)
+        if crossover is None:
+            print(f"{backend}: не быстрее int на измеренных размерах")
+        else:
+            print(f"{backend}: быстрее int начиная с {crossover} цифр")
+    if len(results) == 1:
+        print("gmpy2 не установлен, доступен только встроенный int")
+
+
+if __name__ == "__main__":
+    main()
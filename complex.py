@@ -1,6 +1,10 @@
 import math
+import int_backend
 from fraction_class import Fraction
 
+# Вещественные типы, которые приводятся к Complex в арифметических операциях.
+_REAL_TYPES = int_backend.INTEGER_TYPES + (float,)
+
 
 class Complex:
     """
@@ -97,7 +101,7 @@ class Complex:
         :return: Новое комплексное число.
         :raises TypeError: Если other не является Complex, int или float.
         """
-        if isinstance(other, (int, float)):
+        if isinstance(other, _REAL_TYPES):
             other = Complex(other)
         elif not isinstance(other, Complex):
             return NotImplemented
@@ -111,7 +115,7 @@ class Complex:
         :return: Новое комплексное число.
         :raises TypeError: Если other не является Complex, int или float.
         """
-        if isinstance(other, (int, float)):
+        if isinstance(other, _REAL_TYPES):
             other = Complex(other)
         elif not isinstance(other, Complex):
             return NotImplemented
@@ -125,7 +129,7 @@ class Complex:
         :return: Новое комплексное число.
         :raises TypeError: Если other не является Complex, int или float.
         """
-        if isinstance(other, (int, float)):
+        if isinstance(other, _REAL_TYPES):
             other = Complex(other)
         elif not isinstance(other, Complex):
             return NotImplemented
@@ -143,7 +147,7 @@ class Complex:
         :raises TypeError: Если other не является Complex, int или float.
         :raises ZeroDivisionError: Если other равен нулю.
         """
-        if isinstance(other, (int, float)):
+        if isinstance(other, _REAL_TYPES):
             other = Complex(other)
         elif not isinstance(other, Complex):
             return NotImplemented
@@ -163,12 +167,12 @@ class Complex:
         :return: self.
         :raises TypeError: Если other не является Complex, int или float.
         """
-        if isinstance(other, (int, float)):
+        if isinstance(other, _REAL_TYPES):
             other = Complex(other)
         elif not isinstance(other, Complex):
             return NotImplemented
-        self.real += other.real
-        self.imag += other.imag
+        self._real = self._real + other._real
+        self._imag = self._imag + other._imag
         return self
 
     def __isub__(self, other):
@@ -179,12 +183,12 @@ class Complex:
         :return: self.
         :raises TypeError: Если other не является Complex, int или float.
         """
-        if isinstance(other, (int, float)):
+        if isinstance(other, _REAL_TYPES):
             other = Complex(other)
         elif not isinstance(other, Complex):
             return NotImplemented
-        self.real -= other.real
-        self.imag -= other.imag
+        self._real = self._real - other._real
+        self._imag = self._imag - other._imag
         return self
 
     def __imul__(self, other):
@@ -195,14 +199,12 @@ class Complex:
         :return: self.
         :raises TypeError: Если other не является Complex, int или float.
         """
-        if isinstance(other, (int, float)):
+        if isinstance(other, _REAL_TYPES):
             other = Complex(other)
         elif not isinstance(other, Complex):
             return NotImplemented
-        new_real = self.real * other.real - self.imag * other.imag
-        new_imag = self.real * other.imag + self.imag * other.real
-        self.real = new_real
-        self.imag = new_imag
+        self._real, self._imag = (self._real * other._real - self._imag * other._imag,
+                                  self._real * other._imag + self._imag * other._real)
         return self
 
     def __itruediv__(self, other):
@@ -214,17 +216,15 @@ class Complex:
         :raises TypeError: Если other не является Complex, int или float.
         :raises ZeroDivisionError: Если other равен нулю.
         """
-        if isinstance(other, (int, float)):
+        if isinstance(other, _REAL_TYPES):
             other = Complex(other)
         elif not isinstance(other, Complex):
             return NotImplemented
         denominator = other.real ** 2 + other.imag ** 2
         if denominator == 0:
             raise ZeroDivisionError("Нельзя делить на ноль.")
-        new_real = (self.real * other.real + self.imag * other.imag) / denominator
-        new_imag = (self.imag * other.real - self.real * other.imag) / denominator
-        self.real = new_real
-        self.imag = new_imag
+        self._real, self._imag = ((self._real * other._real + self._imag * other._imag) / denominator,
+                                  (self._imag * other._real - self._real * other._imag) / denominator)
         return self
 
     def __eq__(self, other):
@@ -235,7 +235,7 @@ class Complex:
         :return: True, если числа равны, иначе False.
         :raises TypeError: Если other не является Complex, int или float.
         """
-        if isinstance(other, (int, float)):
+        if isinstance(other, _REAL_TYPES):
             other = Complex(other)
         elif not isinstance(other, Complex):
             return NotImplemented
@@ -259,13 +259,80 @@ class Complex:
         """
         return Complex(-self.real, -self.imag)
 
+    def _derived(self):
+        """
+        Кэш производных величин (квадрат модуля, модуль, аргумент).
+
+        Кэш действителен, пока не заменены части числа и их числители и
+        знаменатели (проверка по тождеству объектов, как в Fraction._interval),
+        поэтому изменения через сеттеры и операторы на месте его сбрасывают.
+
+        :return: Словарь кэшированных значений.
+        """
+        real, imag = self._real, self._imag
+        key = (real, imag, real.numerator, real.denominator, imag.numerator, imag.denominator)
+        cache = getattr(self, "_derived_cache", None)
+        if cache is not None and all(a is b for a, b in zip(cache[0], key)):
+            return cache[1]
+        values = {}
+        self._derived_cache = (key, values)
+        return values
+
+    def _norm(self):
+        """
+        Внутренний (не передаваемый наружу) квадрат модуля.
+        """
+        derived = self._derived()
+        norm = derived.get("norm")
+        if norm is None:
+            real, imag = self._real, self._imag
+            if real.denominator == imag.denominator:
+                norm = Fraction(real.numerator ** 2 + imag.numerator ** 2, real.denominator ** 2)
+            else:
+                norm = Fraction(
+                    (real.numerator * imag.denominator) ** 2 + (imag.numerator * real.denominator) ** 2,
+                    (real.denominator * imag.denominator) ** 2,
+                )
+            derived["norm"] = norm
+        return norm
+
+    def norm(self):
+        """
+        Точный квадрат модуля |z|² = real² + imag².
+
+        Значение кэшируется; возвращается независимая копия. Подходит как
+        ключ сортировки по модулю: sorted(values, key=Complex.norm).
+
+        :return: Fraction.
+        """
+        norm = self._norm()
+        return Fraction._from_reduced(norm.numerator, norm.denominator)
+
+    def compare_abs(self, other):
+        """
+        Точное сравнение модулей без извлечения корня (по квадратам модулей).
+
+        :param other: Другое комплексное число, целое число или число с плавающей точкой.
+        :return: -1, 0 или 1 в зависимости от знака |self| - |other|.
+        :raises TypeError: Если other не является Complex, Fraction, int или float.
+        """
+        if isinstance(other, _REAL_TYPES + (Fraction,)):
+            other = Complex(other)
+        elif not isinstance(other, Complex):
+            raise TypeError("Ожидается Complex, Fraction, int или float.")
+        return self._norm()._compare(other._norm())
+
     def __abs__(self):
         """
         Перегрузка функции abs().
 
-        :return: Модуль комплексного числа (float).
+        :return: Модуль комплексного числа (float), кэшируется.
         """
-        return math.sqrt(float(self.real ** 2 + self.imag ** 2))
+        derived = self._derived()
+        modulus = derived.get("abs")
+        if modulus is None:
+            modulus = derived["abs"] = math.hypot(float(self._real), float(self._imag))
+        return modulus
 
     def __pow__(self, n):
         """
@@ -281,9 +348,16 @@ class Complex:
         if n == 0:
             return Complex(1)  # Любое число в степени 0 равно 1
 
+        # Бинарное возведение: O(log n) умножений вместо n
         result = Complex(1)
-        for _ in range(abs(n)):
-            result *= self
+        base = self
+        exponent = abs(n)
+        while exponent:
+            if exponent & 1:
+                result = result * base
+            exponent >>= 1
+            if exponent:
+                base = base * base
 
         if n < 0:
             return Complex(1) / result
@@ -293,17 +367,26 @@ class Complex:
         """
         Вычисление аргумента комплексного числа в радианах.
 
-        :return: Аргумент комплексного числа (float).
+        :return: Аргумент комплексного числа (float), кэшируется.
         """
-        return math.atan2(float(self.imag), float(self.real))
+        derived = self._derived()
+        angle = derived.get("arg")
+        if angle is None:
+            angle = derived["arg"] = math.atan2(float(self._imag), float(self._real))
+        return angle
 
     def conjugate(self):
         """
         Вычисление сопряженного комплексного числа.
 
+        Части уже несократимы, поэтому НОД не вычисляется; результат —
+        независимое число со своими объектами Fraction.
+
         :return: Новое комплексное число.
         """
-        return Complex(self.real, -self.imag)
+        real, imag = self._real, self._imag
+        return Complex(Fraction._from_reduced(real.numerator, real.denominator),
+                       Fraction._from_reduced(-imag.numerator, imag.denominator))
 
     def exp(self):
         """
@@ -329,7 +412,7 @@ class Complex:
 
         :return: True, если число действительное, иначе False.
         """
-        return self.imag == 0
+        return self.imag.sign() == 0
 
     def is_imaginary(self):
         """
@@ -337,4 +420,4 @@ class Complex:
 
         :return: True, если число чисто мнимое, иначе False.
         """
-        return self.real == 0
+        return self.real.sign() == 0
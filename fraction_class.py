@@ -1,4 +1,166 @@
 import math
+import re
+import sys
+from decimal import (
+    Decimal, ROUND_CEILING, ROUND_DOWN, ROUND_FLOOR, ROUND_HALF_DOWN, ROUND_HALF_EVEN, ROUND_HALF_UP, ROUND_UP,
+)
+from functools import lru_cache
+import int_backend
+
+# Относительный запас интервала: покрывает усечение до 64 бит и округление float.
+_INTERVAL_SLACK = 2.0 ** -50
+_TINY = math.ulp(0.0)
+
+# Малые простые для отсева чисел, не являющихся точными степенями.
+_ROOT_FILTER_PRIMES = (3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53, 59, 61, 67, 71, 73,
+                       79, 83, 89, 97, 101, 103, 107, 109, 113, 127, 131, 137, 139, 149, 151, 157)
+
+# Наибольшая длина периода, при которой строится полная десятичная запись.
+_MAX_PERIOD = 100000
+
+# Разрядность, до которой целое переводится в строку встроенным str.
+_STR_THRESHOLD_BITS = 8000
+
+# Количество кэшируемых степеней десяти: показатели приходят из произвольных
+# запросов форматирования, поэтому кэш ограничен.
+_POWER_OF_TEN_CACHE_SIZE = 128
+
+_FORMAT_SPEC = re.compile(r"""
+    (?:(?P<fill>.)?(?P<align>[<>=^]))?
+    (?P<sign>[-+ ]?)
+    (?P<zeropad>0)?
+    (?P<width>\d+)?
+    (?P<grouping>[,_])?
+    (?:\.(?P<precision>\d+))?
+    (?P<type>[eEfF%]?)
+""", re.DOTALL | re.VERBOSE)
+
+# Разрядность, начиная с которой разложение в цепную дробь идёт по алгоритму Лемера.
+_LEHMER_THRESHOLD = 128
+
+
+def _is_power_of_two(value):
+    """
+    Проверка, является ли положительное число степенью двойки.
+    """
+    return value & (value - 1) == 0
+
+
+@lru_cache(maxsize=64)
+def _power_residues(degree):
+    """
+    Множества вычетов степени degree по малым простым p, у которых p - 1
+    делится на degree. При gcd(degree, p - 1) = 1 каждый вычет является
+    такой степенью и отсеивать нечего; простые с 1 < gcd(degree, p - 1) < degree
+    тоже пропускаются — отсев от этого лишь слабее, но остаётся корректным.
+    """
+    return tuple(
+        (p, frozenset(pow(x, degree, p) for x in range(p)))
+        for p in _ROOT_FILTER_PRIMES if (p - 1) % degree == 0
+    )
+
+
+def _integer_root(value, degree):
+    """
+    Точный целый корень степени degree из неотрицательного числа.
+
+    Сначала выполняется быстрый отсев: число младших нулевых битов должно
+    делиться на degree, а остатки по малым простым — быть вычетами степени
+    degree. Корень затем находится методом Ньютона и проверяется.
+
+    :return: Корень или None, если число не является точной степенью.
+    """
+    if value < 2:
+        return value
+    if value.bit_length() <= degree:
+        return None  # 2^degree > value, а корень 1 уже исключён
+    if ((value & -value).bit_length() - 1) % degree:
+        return None
+    for p, residues in _power_residues(degree):
+        if value % p not in residues:
+            return None
+    if degree == 2:
+        root = math.isqrt(value)
+    else:
+        root = 1 << -(-value.bit_length() // degree)
+        while True:
+            estimate = ((degree - 1) * root + value // root ** (degree - 1)) // degree
+            if estimate >= root:
+                break
+            root = estimate
+    return root if root ** degree == value else None
+
+
+@lru_cache(maxsize=_POWER_OF_TEN_CACHE_SIZE)
+def _power_of_ten(exponent):
+    """
+    Кэшированная степень десяти; хранятся последние _POWER_OF_TEN_CACHE_SIZE значений.
+    """
+    return 10 ** exponent
+
+
+def _int_to_decimal(value, width=0):
+    """
+    Перевод неотрицательного целого в десятичную строку методом «разделяй и властвуй».
+
+    Число делится на 10^k примерно посередине, половины переводятся
+    рекурсивно; это быстрее встроенного str для больших чисел и не упирается
+    в ограничение sys.set_int_max_str_digits.
+
+    :param value: Неотрицательное целое число.
+    :param width: Минимальная длина результата (дополняется нулями слева).
+    :return: Строка цифр.
+    """
+    if value.bit_length() <= _STR_THRESHOLD_BITS:
+        return str(value).zfill(width)
+    half = int(value.bit_length() * 0.30102999566398120) // 2
+    high, low = divmod(value, _power_of_ten(half))
+    return _int_to_decimal(high, max(width - half, 0)) + _int_to_decimal(low, half)
+
+
+def _round_division(numerator, denominator, rounding):
+    """
+    Округление частного numerator / denominator до целого.
+
+    :param numerator: Целое число.
+    :param denominator: Положительное целое число.
+    :param rounding: Режим округления из модуля decimal.
+    :return: Целое число.
+    :raises ValueError: Если режим округления не поддерживается.
+    """
+    quotient, remainder = divmod(numerator, denominator)
+    if remainder == 0:
+        return quotient
+    negative = numerator < 0
+    if rounding == ROUND_FLOOR:
+        return quotient
+    if rounding == ROUND_CEILING:
+        return quotient + 1
+    if rounding == ROUND_DOWN:
+        return quotient + negative
+    if rounding == ROUND_UP:
+        return quotient + (not negative)
+    if rounding not in (ROUND_HALF_EVEN, ROUND_HALF_UP, ROUND_HALF_DOWN):
+        raise ValueError(f"Режим округления {rounding!r} не поддерживается.")
+    twice = 2 * remainder
+    if twice < denominator:
+        return quotient
+    if twice > denominator:
+        return quotient + 1
+    if rounding == ROUND_HALF_UP:
+        return quotient + (not negative)
+    if rounding == ROUND_HALF_DOWN:
+        return quotient + negative
+    return quotient + (quotient & 1)
+
+
+def _group_digits(digits, separator):
+    """
+    Разделение целой части на группы по три цифры.
+    """
+    head = len(digits) % 3 or 3
+    groups = [digits[:head]] + [digits[i:i + 3] for i in range(head, len(digits), 3)]
+    return separator.join(groups)
 
 
 class Fraction:
@@ -8,8 +170,13 @@ class Fraction:
     Атрибуты:
         numerator (int): Числитель дроби.
         denominator (int): Знаменатель дроби.
+        filtered (bool): Режим фильтрованной арифметики: сравнения сначала
+            выполняются по кэшированному интервалу float и переходят к точным
+            целым числам, только если интервалы пересекаются.
     """
 
+    filtered = True
+
     def __init__(self, numerator, denominator=1):
         """
         Инициализация дроби.
@@ -19,7 +186,8 @@ class Fraction:
         :raises TypeError: Если числитель или знаменатель не являются целыми числами.
         :raises ValueError: Если знаменатель равен нулю.
         """
-        if not (isinstance(numerator, int) and isinstance(denominator, int)):
+        integer_types = int_backend.INTEGER_TYPES
+        if not (isinstance(numerator, integer_types) and isinstance(denominator, integer_types)):
             raise TypeError("Числитель и знаменатель должны быть целыми числами.")
         if denominator == 0:
             raise ValueError("Знаменатель не может быть равен нулю.")
@@ -31,8 +199,14 @@ class Fraction:
     def _simplify(self):
         """
         Упрощает дробь, деля числитель и знаменатель на их НОД.
+
+        Для двоично-рациональных дробей (знаменатель — степень двойки) НОД
+        находится по числу младших нулевых битов и сокращение сводится к сдвигу.
         """
-        common_divisor = math.gcd(self.numerator, self.denominator)
+        if self.denominator > 0 and _is_power_of_two(self.denominator):
+            self.numerator, self.denominator = self._shift_reduce(self.numerator, self.denominator)
+            return
+        common_divisor = int_backend.gcd(self.numerator, self.denominator)
         self.numerator //= common_divisor
         self.denominator //= common_divisor
         if self.denominator < 0:  # Убедимся, что знаменатель положительный
@@ -50,11 +224,132 @@ class Fraction:
         """
         if not isinstance(value, float):
             raise TypeError("Ожидается число с плавающей точкой.")
-        decimal_places = len(str(value).split('.')[1])
-        denominator = 10 ** decimal_places
-        numerator = int(value * denominator)
+        # Точное десятичное значение кратчайшей записи числа (в том числе 1e-17).
+        numerator, denominator = Decimal(repr(value)).as_integer_ratio()
         return cls(numerator, denominator)
 
+    @staticmethod
+    def _shift_reduce(numerator, denominator):
+        """
+        Сокращает дробь со знаменателем-степенью двойки сдвигом вправо.
+
+        :return: Кортеж (числитель, знаменатель) несократимой дроби.
+        """
+        if numerator == 0:
+            return numerator, 1
+        shift = min((numerator & -numerator).bit_length(), denominator.bit_length()) - 1
+        return numerator >> shift, denominator >> shift
+
+    @classmethod
+    def _from_dyadic(cls, numerator, denominator):
+        """
+        Создает Fraction из числителя и знаменателя-степени двойки без вычисления НОД.
+
+        :param numerator: Числитель.
+        :param denominator: Знаменатель — положительная степень двойки.
+        :return: Объект Fraction.
+        """
+        return cls._from_reduced(*cls._shift_reduce(numerator, denominator))
+
+    def is_dyadic(self):
+        """
+        Проверка, является ли дробь двоично-рациональной (знаменатель — степень двойки).
+
+        :return: True или False.
+        """
+        return _is_power_of_two(self.denominator)
+
+    @classmethod
+    def _from_reduced(cls, numerator, denominator):
+        """
+        Создает Fraction из заведомо несократимой пары без вычисления НОД.
+
+        :param numerator: Числитель.
+        :param denominator: Положительный знаменатель, взаимно простой с числителем.
+        :return: Объект Fraction.
+        """
+        result = cls.__new__(cls)
+        result.numerator = numerator
+        result.denominator = denominator
+        return result
+
+    def continued_fraction(self):
+        """
+        Ленивое разложение дроби в цепную дробь [a0; a1, a2, ...].
+
+        Неполные частные вычисляются алгоритмом Лемера: несколько шагов
+        алгоритма Евклида выполняются над старшими 64 битами, после чего
+        накопленная матрица применяется к длинным числам. Генератор можно
+        остановить в любой момент, не вычисляя разложение целиком.
+
+        :return: Генератор целых чисел.
+        """
+        u, v = self.numerator, self.denominator
+        quotient, remainder = divmod(u, v)
+        yield quotient
+        u, v = v, remainder
+        while v:
+            if u.bit_length() <= _LEHMER_THRESHOLD:
+                quotient, remainder = divmod(u, v)
+                yield quotient
+                u, v = v, remainder
+                continue
+            shift = u.bit_length() - 64
+            x, y = u >> shift, v >> shift
+            a, b, c, d = 1, 0, 0, 1
+            while y + c != 0 and y + d != 0:
+                quotient = (x + a) // (y + c)
+                if quotient != (x + b) // (y + d):
+                    break
+                yield quotient
+                a, c = c, a - quotient * c
+                b, d = d, b - quotient * d
+                x, y = y, x - quotient * y
+            if b == 0:
+                quotient, remainder = divmod(u, v)
+                yield quotient
+                u, v = v, remainder
+            else:
+                u, v = a * u + b * v, c * u + d * v
+
+    def convergents(self):
+        """
+        Ленивая последовательность подходящих дробей.
+
+        :return: Генератор Fraction, последний элемент равен самой дроби.
+        """
+        p0, q0, p1, q1 = 0, 1, 1, 0
+        for term in self.continued_fraction():
+            p0, q0, p1, q1 = p1, q1, term * p1 + p0, term * q1 + q0
+            yield Fraction._from_reduced(p1, q1)
+
+    def limit_denominator(self, max_denominator=1000000):
+        """
+        Ближайшая дробь со знаменателем не больше max_denominator.
+
+        :param max_denominator: Максимальный знаменатель (целое число >= 1).
+        :return: Новая дробь.
+        :raises ValueError: Если max_denominator меньше 1.
+        """
+        if max_denominator < 1:
+            raise ValueError("Максимальный знаменатель должен быть не меньше 1.")
+        if self.denominator <= max_denominator:
+            return Fraction._from_reduced(self.numerator, self.denominator)
+        p0, q0, p1, q1 = 0, 1, 1, 0
+        for term in self.continued_fraction():
+            q2 = q0 + term * q1
+            if q2 > max_denominator:
+                break
+            p0, q0, p1, q1 = p1, q1, p0 + term * p1, q2
+        k = (max_denominator - q0) // q1
+        p_semi, q_semi = p0 + k * p1, q0 + k * q1
+        # Расстояния до self сравниваются без построения дробей и вычисления НОД.
+        error_convergent = abs(p1 * self.denominator - q1 * self.numerator) * q_semi
+        error_semi = abs(p_semi * self.denominator - q_semi * self.numerator) * q1
+        if error_convergent <= error_semi:
+            return Fraction._from_reduced(p1, q1)
+        return Fraction._from_reduced(p_semi, q_semi)
+
     def __add__(self, other):
         """
         Сложение двух дробей.
@@ -63,12 +358,19 @@ class Fraction:
         :return: Новая дробь.
         :raises TypeError: Если other не является Fraction, int или float.
         """
-        if isinstance(other, int):
+        if isinstance(other, int_backend.INTEGER_TYPES):
             other = Fraction(other)
         elif isinstance(other, float):
             other = Fraction.from_float(other)
         elif not isinstance(other, Fraction):
             return NotImplemented
+        if _is_power_of_two(self.denominator) and _is_power_of_two(other.denominator):
+            # Двоично-рациональный путь: выравнивание знаменателей сдвигом
+            if self.denominator >= other.denominator:
+                shift = self.denominator.bit_length() - other.denominator.bit_length()
+                return Fraction._from_dyadic(self.numerator + (other.numerator << shift), self.denominator)
+            shift = other.denominator.bit_length() - self.denominator.bit_length()
+            return Fraction._from_dyadic((self.numerator << shift) + other.numerator, other.denominator)
         new_numerator = self.numerator * other.denominator + other.numerator * self.denominator
         new_denominator = self.denominator * other.denominator
         result = Fraction(new_numerator, new_denominator)
@@ -83,12 +385,19 @@ class Fraction:
         :return: Новая дробь.
         :raises TypeError: Если other не является Fraction, int или float.
         """
-        if isinstance(other, int):
+        if isinstance(other, int_backend.INTEGER_TYPES):
             other = Fraction(other)
         elif isinstance(other, float):
             other = Fraction.from_float(other)
         elif not isinstance(other, Fraction):
             return NotImplemented
+        if _is_power_of_two(self.denominator) and _is_power_of_two(other.denominator):
+            # Двоично-рациональный путь: выравнивание знаменателей сдвигом
+            if self.denominator >= other.denominator:
+                shift = self.denominator.bit_length() - other.denominator.bit_length()
+                return Fraction._from_dyadic(self.numerator - (other.numerator << shift), self.denominator)
+            shift = other.denominator.bit_length() - self.denominator.bit_length()
+            return Fraction._from_dyadic((self.numerator << shift) - other.numerator, other.denominator)
         new_numerator = self.numerator * other.denominator - other.numerator * self.denominator
         new_denominator = self.denominator * other.denominator
         result = Fraction(new_numerator, new_denominator)
@@ -103,12 +412,14 @@ class Fraction:
         :return: Новая дробь.
         :raises TypeError: Если other не является Fraction, int или float.
         """
-        if isinstance(other, int):
+        if isinstance(other, int_backend.INTEGER_TYPES):
             other = Fraction(other)
         elif isinstance(other, float):
             other = Fraction.from_float(other)
         elif not isinstance(other, Fraction):
             return NotImplemented
+        if _is_power_of_two(self.denominator) and _is_power_of_two(other.denominator):
+            return Fraction._from_dyadic(self.numerator * other.numerator, self.denominator * other.denominator)
         new_numerator = self.numerator * other.numerator
         new_denominator = self.denominator * other.denominator
         result = Fraction(new_numerator, new_denominator)
@@ -124,7 +435,7 @@ class Fraction:
         :raises TypeError: Если other не является Fraction, int или float.
         :raises ZeroDivisionError: Если other равен нулю.
         """
-        if isinstance(other, int):
+        if isinstance(other, int_backend.INTEGER_TYPES):
             other = Fraction(other)
         elif isinstance(other, float):
             other = Fraction.from_float(other)
@@ -132,6 +443,13 @@ class Fraction:
             return NotImplemented
         if other.numerator == 0:
             raise ZeroDivisionError("Нельзя делить на ноль.")
+        divisor = abs(other.numerator)
+        if _is_power_of_two(self.denominator) and _is_power_of_two(divisor):
+            # Деление на ±2^k не выводит из множества двоично-рациональных дробей
+            numerator = self.numerator * other.denominator
+            if other.numerator < 0:
+                numerator = -numerator
+            return Fraction._from_dyadic(numerator, self.denominator * divisor)
         new_numerator = self.numerator * other.denominator
         new_denominator = self.denominator * other.numerator
         result = Fraction(new_numerator, new_denominator)
@@ -146,7 +464,7 @@ class Fraction:
         :return: self.
         :raises TypeError: Если other не является Fraction, int или float.
         """
-        if isinstance(other, int):
+        if isinstance(other, int_backend.INTEGER_TYPES):
             other = Fraction(other)
         elif isinstance(other, float):
             other = Fraction.from_float(other)
@@ -165,7 +483,7 @@ class Fraction:
         :return: self.
         :raises TypeError: Если other не является Fraction, int или float.
         """
-        if isinstance(other, int):
+        if isinstance(other, int_backend.INTEGER_TYPES):
             other = Fraction(other)
         elif isinstance(other, float):
             other = Fraction.from_float(other)
@@ -184,7 +502,7 @@ class Fraction:
         :return: self.
         :raises TypeError: Если other не является Fraction, int или float.
         """
-        if isinstance(other, int):
+        if isinstance(other, int_backend.INTEGER_TYPES):
             other = Fraction(other)
         elif isinstance(other, float):
             other = Fraction.from_float(other)
@@ -204,7 +522,7 @@ class Fraction:
         :raises TypeError: Если other не является Fraction, int или float.
         :raises ZeroDivisionError: Если other равен нулю.
         """
-        if isinstance(other, int):
+        if isinstance(other, int_backend.INTEGER_TYPES):
             other = Fraction(other)
         elif isinstance(other, float):
             other = Fraction.from_float(other)
@@ -225,7 +543,7 @@ class Fraction:
         :return: True, если дроби равны, иначе False.
         :raises TypeError: Если other не является Fraction, int или float.
         """
-        if isinstance(other, int):
+        if isinstance(other, int_backend.INTEGER_TYPES):
             return self.numerator == other and self.denominator == 1
         elif isinstance(other, float):
             return float(self) == other
@@ -243,6 +561,128 @@ class Fraction:
         """
         return not self.__eq__(other)
 
+    def _interval(self):
+        """
+        Интервал [lo, hi] чисел с плавающей точкой, содержащий значение дроби.
+
+        Вычисляется по старшим 64 битам числителя и знаменателя и кэшируется;
+        кэш сбрасывается, как только меняется числитель или знаменатель.
+
+        :return: Кортеж (lo, hi).
+        """
+        cache = getattr(self, "_interval_cache", None)
+        if cache is not None and cache[0] is self.numerator and cache[1] is self.denominator:
+            return cache[2], cache[3]
+        numerator, denominator = abs(self.numerator), self.denominator
+        if numerator == 0:
+            lo = hi = 0.0
+        else:
+            shift_n = max(numerator.bit_length() - 64, 0)
+            shift_d = max(denominator.bit_length() - 64, 0)
+            top_n = int(numerator >> shift_n)
+            top_d = int(denominator >> shift_d)
+            exponent = shift_n - shift_d
+            try:
+                lo = math.ldexp(top_n / (top_d + (shift_d > 0)), exponent)
+            except OverflowError:
+                lo = sys.float_info.max
+            try:
+                hi = math.ldexp((top_n + (shift_n > 0)) / top_d, exponent)
+            except OverflowError:
+                hi = math.inf
+            lo = max(lo * (1 - _INTERVAL_SLACK) - _TINY, 0.0)
+            hi = hi * (1 + _INTERVAL_SLACK) + _TINY
+            if self.numerator < 0:
+                lo, hi = -hi, -lo
+        self._interval_cache = (self.numerator, self.denominator, lo, hi)
+        return lo, hi
+
+    def _compare(self, other):
+        """
+        Сравнение с другой дробью.
+
+        :param other: Другая дробь.
+        :return: -1, 0 или 1.
+        """
+        if Fraction.filtered:
+            self_lo, self_hi = self._interval()
+            other_lo, other_hi = other._interval()
+            if self_hi < other_lo:
+                return -1
+            if self_lo > other_hi:
+                return 1
+        left = self.numerator * other.denominator
+        right = other.numerator * self.denominator
+        return (left > right) - (left < right)
+
+    def __lt__(self, other):
+        """
+        Оператор <.
+
+        :param other: Другая дробь, целое число или число с плавающей точкой.
+        :return: True, если дробь меньше other, иначе False.
+        """
+        if isinstance(other, int_backend.INTEGER_TYPES):
+            other = Fraction(other)
+        elif isinstance(other, float):
+            other = Fraction.from_float(other)
+        elif not isinstance(other, Fraction):
+            return NotImplemented
+        return self._compare(other) < 0
+
+    def __le__(self, other):
+        """
+        Оператор <=.
+
+        :param other: Другая дробь, целое число или число с плавающей точкой.
+        :return: True, если дробь меньше или равна other, иначе False.
+        """
+        if isinstance(other, int_backend.INTEGER_TYPES):
+            other = Fraction(other)
+        elif isinstance(other, float):
+            other = Fraction.from_float(other)
+        elif not isinstance(other, Fraction):
+            return NotImplemented
+        return self._compare(other) <= 0
+
+    def __gt__(self, other):
+        """
+        Оператор >.
+
+        :param other: Другая дробь, целое число или число с плавающей точкой.
+        :return: True, если дробь больше other, иначе False.
+        """
+        if isinstance(other, int_backend.INTEGER_TYPES):
+            other = Fraction(other)
+        elif isinstance(other, float):
+            other = Fraction.from_float(other)
+        elif not isinstance(other, Fraction):
+            return NotImplemented
+        return self._compare(other) > 0
+
+    def __ge__(self, other):
+        """
+        Оператор >=.
+
+        :param other: Другая дробь, целое число или число с плавающей точкой.
+        :return: True, если дробь больше или равна other, иначе False.
+        """
+        if isinstance(other, int_backend.INTEGER_TYPES):
+            other = Fraction(other)
+        elif isinstance(other, float):
+            other = Fraction.from_float(other)
+        elif not isinstance(other, Fraction):
+            return NotImplemented
+        return self._compare(other) >= 0
+
+    def sign(self):
+        """
+        Знак дроби.
+
+        :return: -1, 0 или 1.
+        """
+        return (self.numerator > 0) - (self.numerator < 0)
+
     def __neg__(self):
         """
         Унарный минус.
@@ -253,19 +693,59 @@ class Fraction:
         result._simplify()  # Упрощаем результат
         return result
 
-    def __pow__(self, power):
+    def __pow__(self, power, modulo=None):
         """
         Возведение дроби в степень.
 
-        :param power: Степень (целое число).
+        Степени взаимно простых чисел взаимно просты, поэтому результат не
+        сокращается. Отрицательная степень меняет местами числитель и
+        знаменатель. Дробная степень p/q вычисляется через точный корень
+        степени q и допустима, только если результат рационален.
+
+        :param power: Степень (целое число или Fraction).
+        :param modulo: Модуль для трёхаргументного pow (только для целых дробей и степеней).
         :return: Новая дробь.
-        :raises TypeError: Если power не является целым числом.
-        """
-        if not isinstance(power, int):
+        :raises TypeError: Если power не является целым числом или Fraction,
+            либо при modulo дробь или степень не целые.
+        :raises ZeroDivisionError: Если ноль возводится в отрицательную степень.
+        :raises ValueError: Если результат дробной степени иррационален или не является
+            действительным числом.
+        """
+        integer_types = int_backend.INTEGER_TYPES
+        if modulo is not None:
+            if not (isinstance(power, integer_types) and isinstance(modulo, integer_types)
+                    and self.denominator == 1):
+                raise TypeError("Для pow по модулю дробь, степень и модуль должны быть целыми.")
+            return Fraction._from_reduced(pow(self.numerator, power, modulo), 1)
+        if isinstance(power, Fraction):
+            if power.denominator == 1:
+                power = power.numerator
+            else:
+                return self._root(power.denominator) ** power.numerator
+        if not isinstance(power, integer_types):
             raise TypeError("Степень должна быть целым числом.")
-        result = Fraction(self.numerator ** power, self.denominator ** power)
-        result._simplify()  # Упрощаем результат
-        return result
+        if power >= 0:
+            return Fraction._from_reduced(self.numerator ** power, self.denominator ** power)
+        if self.numerator == 0:
+            raise ZeroDivisionError("Ноль нельзя возводить в отрицательную степень.")
+        numerator, denominator = self.denominator ** -power, self.numerator ** -power
+        if denominator < 0:
+            numerator, denominator = -numerator, -denominator
+        return Fraction._from_reduced(numerator, denominator)
+
+    def _root(self, degree):
+        """
+        Точный корень степени degree из дроби.
+
+        :raises ValueError: Если корень иррационален или не является действительным числом.
+        """
+        if self.numerator < 0 and degree % 2 == 0:
+            raise ValueError("Корень чётной степени из отрицательного числа не является действительным.")
+        numerator = _integer_root(abs(self.numerator), degree)
+        denominator = _integer_root(self.denominator, degree) if numerator is not None else None
+        if denominator is None:
+            raise ValueError("Результат возведения в дробную степень иррационален.")
+        return Fraction._from_reduced(-numerator if self.numerator < 0 else numerator, denominator)
 
     def __float__(self):
         """
@@ -273,7 +753,7 @@ class Fraction:
 
         :return: Число с плавающей точкой.
         """
-        return self.numerator / self.denominator
+        return int_backend.true_divide(self.numerator, self.denominator)
 
     def __int__(self):
         """
@@ -281,7 +761,7 @@ class Fraction:
 
         :return: Целое число.
         """
-        return self.numerator // self.denominator
+        return int(self.numerator // self.denominator)
 
     def __abs__(self):
         """
@@ -302,6 +782,171 @@ class Fraction:
         """
         return round(float(self), ndigits)
 
+    def _fixed_digits(self, digits, rounding):
+        """
+        Округленное значение в фиксированной записи.
+
+        :return: Кортеж (признак отрицательности, целая часть, дробная часть);
+            знак берётся от исходного значения, как у float: "-0.00".
+        """
+        scaled = _round_division(self.numerator * _power_of_ten(digits), self.denominator, rounding)
+        text = _int_to_decimal(abs(scaled), digits + 1)
+        split = len(text) - digits
+        return self.numerator < 0, text[:split], text[split:]
+
+    def _decimal_exponent(self):
+        """
+        Десятичный порядок e, при котором 10^e <= |дробь| < 10^(e + 1).
+        """
+        numerator, denominator = abs(self.numerator), self.denominator
+        exponent = int((numerator.bit_length() - denominator.bit_length()) * 0.30102999566398120)
+        while True:
+            if exponent >= 0:
+                low, high = denominator * _power_of_ten(exponent), numerator
+            else:
+                low, high = denominator, numerator * _power_of_ten(-exponent)
+            if high < low:
+                exponent -= 1
+            elif high >= 10 * low:
+                exponent += 1
+            else:
+                return exponent
+
+    def _scientific_digits(self, digits, rounding):
+        """
+        Округленное значение в экспоненциальной записи.
+
+        :return: Кортеж (признак отрицательности, мантисса без точки, порядок).
+        """
+        if self.numerator == 0:
+            return False, "0" * (digits + 1), 0
+        exponent = self._decimal_exponent()
+        shift = digits - exponent
+        if shift >= 0:
+            scaled = _round_division(self.numerator * _power_of_ten(shift), self.denominator, rounding)
+        else:
+            scaled = _round_division(self.numerator, self.denominator * _power_of_ten(-shift), rounding)
+        if abs(scaled) == _power_of_ten(digits + 1):
+            scaled //= 10
+            exponent += 1
+        return self.numerator < 0, _int_to_decimal(abs(scaled)), exponent
+
+    def to_decimal(self, digits=None, rounding=ROUND_HALF_EVEN, max_period=_MAX_PERIOD):
+        """
+        Точная десятичная запись дроби.
+
+        :param digits: Количество знаков после запятой; если None, возвращается
+            полная запись, периодическая часть заключается в скобки: "0.1(6)".
+        :param rounding: Режим округления из модуля decimal (по умолчанию ROUND_HALF_EVEN).
+        :param max_period: Наибольшая допустимая длина периода для полной записи.
+        :return: Строка.
+        :raises ValueError: Если digits отрицательно, режим округления не поддерживается
+            или период полной записи длиннее max_period.
+        """
+        if digits is None:
+            return self._repeating_decimal(max_period)
+        if digits < 0:
+            raise ValueError("Количество знаков не может быть отрицательным.")
+        negative, integer_part, fraction_part = self._fixed_digits(digits, rounding)
+        text = f"{integer_part}.{fraction_part}" if digits else integer_part
+        return f"-{text}" if negative else text
+
+    def decimal_period(self, max_period=_MAX_PERIOD):
+        """
+        Длины предпериода и периода десятичной записи дроби.
+
+        Период ищется перебором степеней 10 по модулю знаменателя, а его длина
+        может достигать знаменателя, поэтому перебор ограничен max_period шагами.
+
+        :param max_period: Наибольшая допустимая длина периода.
+        :return: Кортеж (длина предпериода, длина периода); период 0 у конечных дробей.
+        :raises ValueError: Если период длиннее max_period.
+        """
+        denominator = self.denominator
+        twos = (denominator & -denominator).bit_length() - 1
+        denominator >>= twos
+        fives = 0
+        while denominator % 5 == 0:
+            denominator //= 5
+            fives += 1
+        period = 0
+        if denominator > 1:
+            period, power = 1, 10 % denominator
+            while power != 1:
+                if period >= max_period:
+                    raise ValueError(f"Период десятичной записи длиннее {max_period} знаков.")
+                power = power * 10 % denominator
+                period += 1
+        return max(twos, fives), period
+
+    def _repeating_decimal(self, max_period=_MAX_PERIOD):
+        """
+        Полная десятичная запись с периодом в скобках.
+        """
+        preperiod, period = self.decimal_period(max_period)
+        negative, integer_part, fraction_part = self._fixed_digits(preperiod + period, ROUND_DOWN)
+        text = integer_part
+        if preperiod or period:
+            text += "." + fraction_part[:preperiod]
+            if period:
+                text += f"({fraction_part[preperiod:]})"
+        return f"-{text}" if negative else text
+
+    def __format__(self, format_spec):
+        """
+        Форматирование дроби с точными десятичными цифрами.
+
+        Поддерживаются типы "f", "F", "e", "E" и "%" с заполнением,
+        выравниванием, знаком, шириной, группировкой разрядов и точностью;
+        без типа выводится строковое представление дроби.
+
+        :param format_spec: Спецификация формата.
+        :return: Строка.
+        :raises ValueError: Если спецификация не поддерживается.
+        """
+        match = _FORMAT_SPEC.fullmatch(format_spec)
+        if match is None:
+            raise ValueError(f"Неподдерживаемая спецификация формата {format_spec!r}.")
+        spec = match.groupdict()
+        if not spec["type"]:
+            if spec["sign"] or spec["zeropad"] or spec["grouping"] or spec["precision"]:
+                raise ValueError(f"Неподдерживаемая спецификация формата {format_spec!r}.")
+            return format(str(self), format_spec)
+
+        precision = 6 if spec["precision"] is None else int(spec["precision"])
+        kind = spec["type"]
+        if kind in "eE":
+            negative, mantissa, exponent = self._scientific_digits(precision, ROUND_HALF_EVEN)
+            integer_part, fraction_part = mantissa[:1], mantissa[1:]
+            suffix = f"{kind}{'-' if exponent < 0 else '+'}{abs(exponent):02d}"
+        else:
+            value = self * 100 if kind == "%" else self
+            negative, integer_part, fraction_part = value._fixed_digits(precision, ROUND_HALF_EVEN)
+            suffix = "%" if kind == "%" else ""
+        sign = "-" if negative else ("" if spec["sign"] in ("", "-") else spec["sign"])
+        fill, align = spec["fill"] or " ", spec["align"]
+        if spec["zeropad"] and not align:
+            fill, align = "0", "="
+        width = int(spec["width"] or 0)
+        tail = (f".{fraction_part}" if precision else "") + suffix
+        if spec["grouping"]:
+            if fill == "0" and align == "=":
+                # Как у float: ведущие нули тоже разбиваются на группы
+                while len(sign) + len(_group_digits(integer_part, spec["grouping"])) + len(tail) < width:
+                    integer_part = "0" + integer_part
+            integer_part = _group_digits(integer_part, spec["grouping"])
+        body = integer_part + tail
+
+        padding = max(width - len(sign) - len(body), 0)
+        if align == "=":
+            return sign + fill * padding + body
+        if align == "<":
+            return sign + body + fill * padding
+        if align == "^":
+            left = padding // 2
+            return fill * left + sign + body + fill * (padding - left)
+        return fill * padding + sign + body
+
     def __str__(self):
         """
         Строковое представление дроби.
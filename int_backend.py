@@ -0,0 +1,55 @@
+import math
+import operator
+
+try:
+    import gmpy2
+except ImportError:  # gmpy2 — необязательная зависимость
+    gmpy2 = None
+
+# Типы, которые Fraction и Complex принимают как целые числа.
+INTEGER_TYPES = (int,) if gmpy2 is None else (int, type(gmpy2.mpz(0)))
+
+_BACKENDS = {
+    "int": (math.gcd, operator.truediv),
+}
+if gmpy2 is not None:
+    _BACKENDS["gmpy2"] = (gmpy2.gcd, lambda n, d: int(n) / int(d))
+
+name = None
+gcd = None
+true_divide = None
+
+
+def available_backends():
+    """
+    Список доступных бэкендов длинной арифметики.
+
+    :return: Список имён бэкендов.
+    """
+    return list(_BACKENDS)
+
+
+def set_backend(backend_name):
+    """
+    Выбор бэкенда для целочисленных операций Fraction.
+
+    :param backend_name: "int" (встроенный int) или "gmpy2" (mpz).
+    :raises ValueError: Если бэкенд неизвестен или не установлен.
+    """
+    global name, gcd, true_divide
+    if backend_name not in _BACKENDS:
+        raise ValueError(f"Бэкенд {backend_name!r} недоступен.")
+    name = backend_name
+    gcd, true_divide = _BACKENDS[backend_name]
+
+
+def get_backend():
+    """
+    Имя текущего бэкенда.
+
+    :return: Строка.
+    """
+    return name
+
+
+set_backend("gmpy2" if gmpy2 is not None else "int")
@@ -0,0 +1,107 @@
+import math
+import int_backend
+from fraction_class import Fraction
+from complex import Complex
+
+
+def as_fraction(value):
+    """
+    Приводит значение к Fraction.
+
+    :param value: Fraction, целое число или число с плавающей точкой.
+    :return: Объект Fraction.
+    :raises TypeError: Если value не является Fraction, int или float.
+    """
+    if isinstance(value, Fraction):
+        return value
+    if isinstance(value, int_backend.INTEGER_TYPES):
+        return Fraction(value)
+    if isinstance(value, float):
+        return Fraction.from_float(value)
+    raise TypeError("Ожидается Fraction, int или float.")
+
+
+def as_complex(value):
+    """
+    Приводит значение к Complex.
+
+    :param value: Complex, Fraction, целое число или число с плавающей точкой.
+    :return: Объект Complex.
+    :raises TypeError: Если value не является Complex, Fraction, int или float.
+    """
+    if isinstance(value, Complex):
+        return value
+    return Complex(as_fraction(value))
+
+
+def scale_fractions(values):
+    """
+    Приводит дроби к общему знаменателю.
+
+    :param values: Последовательность Fraction, int или float.
+    :return: Кортеж (список целых числителей, общий знаменатель).
+    """
+    fractions = [as_fraction(value) for value in values]
+    denominator = math.lcm(*(f.denominator for f in fractions)) if fractions else 1
+    return [f.numerator * (denominator // f.denominator) for f in fractions], denominator
+
+
+def scale_complexes(values):
+    """
+    Приводит комплексные числа к гауссовым целым с общим знаменателем.
+
+    :param values: Последовательность Complex, Fraction, int или float.
+    :return: Кортеж (список пар (re, im) целых чисел, общий знаменатель).
+    """
+    numbers = [as_complex(value) for value in values]
+    denominator = math.lcm(*(part.denominator for z in numbers for part in (z.real, z.imag))) if numbers else 1
+    return [
+        (z.real.numerator * (denominator // z.real.denominator),
+         z.imag.numerator * (denominator // z.imag.denominator))
+        for z in numbers
+    ], denominator
+
+
+def gaussian_mul(a, b):
+    """
+    Произведение гауссовых целых чисел, заданных парами (re, im).
+    """
+    return a[0] * b[0] - a[1] * b[1], a[0] * b[1] + a[1] * b[0]
+
+
+def gaussian_sub(a, b):
+    """
+    Разность гауссовых целых чисел, заданных парами (re, im).
+    """
+    return a[0] - b[0], a[1] - b[1]
+
+
+def gaussian_exact_div(a, b):
+    """
+    Точное деление гауссовых целых чисел (делимость должна быть гарантирована).
+
+    :raises ZeroDivisionError: Если b равно нулю.
+    """
+    norm = b[0] * b[0] + b[1] * b[1]
+    if norm == 0:
+        raise ZeroDivisionError("Нельзя делить на ноль.")
+    return (a[0] * b[0] + a[1] * b[1]) // norm, (a[1] * b[0] - a[0] * b[1]) // norm
+
+
+def gaussian_to_complex(value, denominator=1):
+    """
+    Преобразует гауссово целое (re, im), делённое на denominator, в Complex.
+
+    :param value: Пара (re, im) целых чисел или гауссовых целых.
+    :param denominator: Знаменатель — целое число или гауссово целое (пара).
+    :return: Объект Complex.
+    :raises ZeroDivisionError: Если знаменатель равен нулю.
+    """
+    if isinstance(denominator, int_backend.INTEGER_TYPES):
+        denominator = (denominator, 0)
+    c, d = denominator
+    norm = c * c + d * d
+    if norm == 0:
+        raise ZeroDivisionError("Нельзя делить на ноль.")
+    re, im = value
+    return Complex(Fraction(re * c + im * d, norm), Fraction(im * c - re * d, norm))
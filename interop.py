@@ -0,0 +1,201 @@
+import struct
+from array import array
+from fraction_class import Fraction
+from complex import Complex
+
+try:
+    import numpy
+except ImportError:  # numpy — необязательная зависимость
+    numpy = None
+
+_INTEGER_FORMATS = frozenset("bBhHiIlLqQnN")
+_FLOAT_FORMATS = frozenset("fde")
+_COMPLEX_FORMATS = {"Zf": "f", "Zd": "d"}
+
+
+def _values(data):
+    """
+    Элементы буфера в виде списка чисел Python.
+
+    Буфер в родном порядке байтов читается через memoryview без копирования.
+    Буферы с явным порядком байтов (например, big-endian) и float16, которые
+    memoryview читает неверно или не читает вовсе, декодируются модулем
+    struct по исходному формату.
+
+    :param data: Объект с поддержкой протокола буфера (array.array, bytes, numpy.ndarray).
+    :return: Кортеж (список значений, формат элемента без признака порядка байтов);
+        для комплексных форматов список содержит чередующиеся действительные и мнимые части.
+    :raises TypeError: Если формат буфера не поддерживается.
+    """
+    try:
+        view = memoryview(data)
+    except TypeError:
+        if numpy is None:
+            raise
+        view = memoryview(numpy.ascontiguousarray(data))
+    if not view.c_contiguous:
+        if numpy is None:
+            raise ValueError("Буфер должен быть непрерывным.")
+        view = memoryview(numpy.ascontiguousarray(data))
+    fmt = view.format.lstrip("@=<>!")
+    if fmt not in _INTEGER_FORMATS and fmt not in _FLOAT_FORMATS and fmt not in _COMPLEX_FORMATS:
+        raise TypeError(f"Формат буфера {view.format!r} не поддерживается.")
+    order = view.format[:len(view.format) - len(fmt)]
+    code = _COMPLEX_FORMATS.get(fmt, fmt)
+    if order in ("", "@") and code != "e":
+        if view.ndim != 1 or code != fmt:
+            view = view.cast("B").cast(code)
+        return view.tolist(), fmt
+    return [value for value, in struct.iter_unpack((order or "@") + code, view.cast("B"))], fmt
+
+
+def _exact_float(value):
+    """
+    Точная дробь, равная двоичному значению float.
+    """
+    return Fraction._from_reduced(*value.as_integer_ratio())
+
+
+def from_buffer(data, denominators=None):
+    """
+    Массовое создание Fraction или Complex из буфера.
+
+    Элементы читаются напрямую из памяти через протокол буфера, без
+    промежуточных объектов numpy. Целые буферы дают дроби (с необязательным
+    буфером знаменателей), вещественные — точное двоичное значение каждого
+    float, комплексные (complex64/complex128) — Complex с точными частями.
+
+    :param data: Буфер с целыми, вещественными или комплексными числами.
+    :param denominators: Необязательный буфер целых знаменателей той же длины.
+    :return: Список Fraction или Complex.
+    :raises TypeError: Если формат буфера не поддерживается.
+    :raises ValueError: Если длины числителей и знаменателей не совпадают.
+    """
+    values, fmt = _values(data)
+    if fmt in _COMPLEX_FORMATS:
+        return [
+            Complex(_exact_float(re), _exact_float(im))
+            for re, im in zip(values[0::2], values[1::2])
+        ]
+    if fmt in _FLOAT_FORMATS:
+        if denominators is not None:
+            raise TypeError("Знаменатели допустимы только для целочисленного буфера.")
+        return [_exact_float(value) for value in values]
+    if denominators is None:
+        return [Fraction._from_reduced(value, 1) for value in values]
+    denominator_values, denominator_fmt = _values(denominators)
+    if denominator_fmt not in _INTEGER_FORMATS:
+        raise TypeError("Знаменатели должны быть целыми числами.")
+    if len(denominator_values) != len(values):
+        raise ValueError("Длины числителей и знаменателей не совпадают.")
+    return [Fraction(n, d) for n, d in zip(values, denominator_values)]
+
+from_numpy = from_buffer
+
+
+def _export(typecode, values, dtype):
+    """
+    Упаковка значений в numpy.ndarray или, без numpy, в array.array.
+    """
+    packed = array(typecode, values)
+    if numpy is None:
+        return packed
+    return numpy.frombuffer(packed, dtype=dtype)
+
+
+def to_float64(values):
+    """
+    Приближённый экспорт дробей в массив float64.
+
+    :param values: Последовательность Fraction.
+    :return: numpy.ndarray (или array.array("d"), если numpy не установлен).
+    """
+    return _export("d", (float(value) for value in values), "float64")
+
+
+def to_complex128(values):
+    """
+    Приближённый экспорт комплексных чисел в массив complex128.
+
+    Без numpy возвращается array.array("d") с чередующимися действительными
+    и мнимыми частями — это та же раскладка памяти, что и у complex128.
+
+    :param values: Последовательность Complex.
+    :return: numpy.ndarray (или array.array("d")).
+    """
+    parts = (float(part) for value in values for part in (value.real, value.imag))
+    return _export("d", parts, "complex128")
+
+
+def to_int64_pairs(values):
+    """
+    Точный экспорт дробей в пары (числитель, знаменатель) int64.
+
+    :param values: Последовательность Fraction.
+    :return: numpy.ndarray формы (n, 2) (или плоский array.array("q")).
+    :raises OverflowError: Если числитель или знаменатель не помещается в int64.
+    """
+    packed = _export("q", (part for value in values for part in (value.numerator, value.denominator)), "int64")
+    return packed if numpy is None else packed.reshape(-1, 2)
+
+
+class FractionArray:
+    """
+    Последовательность дробей с обменом данными через протокол буфера.
+
+    Атрибуты:
+        values (list): Список Fraction.
+    """
+
+    def __init__(self, values=()):
+        """
+        :param values: Итерируемый объект с Fraction.
+        """
+        self.values = list(values)
+
+    @classmethod
+    def from_buffer(cls, data, denominators=None):
+        """
+        Создает массив из буфера (см. функцию from_buffer).
+        """
+        return cls(from_buffer(data, denominators))
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, index):
+        return self.values[index]
+
+    def __iter__(self):
+        return iter(self.values)
+
+    def __eq__(self, other):
+        if not isinstance(other, FractionArray):
+            return NotImplemented
+        return self.values == other.values
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.values!r})"
+
+    def __array__(self, dtype=None, copy=None):
+        """
+        Приближённое представление для numpy (float64).
+        """
+        result = to_float64(self.values)
+        return result if dtype is None else result.astype(dtype)
+
+
+class ComplexArray(FractionArray):
+    """
+    Последовательность комплексных чисел с обменом данными через протокол буфера.
+
+    Атрибуты:
+        values (list): Список Complex.
+    """
+
+    def __array__(self, dtype=None, copy=None):
+        """
+        Приближённое представление для numpy (complex128).
+        """
+        result = to_complex128(self.values)
+        return result if dtype is None else result.astype(dtype)
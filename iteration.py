@@ -0,0 +1,154 @@
+import math
+from complex import Complex
+from integer_scaling import as_fraction, scale_complexes, gaussian_to_complex
+
+
+def complex_grid(re_min, re_max, im_min, im_max, width, height):
+    """
+    Прямоугольная сетка точек с рациональными координатами.
+
+    :param re_min: Минимальная действительная часть.
+    :param re_max: Максимальная действительная часть.
+    :param im_min: Минимальная мнимая часть.
+    :param im_max: Максимальная мнимая часть.
+    :param width: Количество точек по действительной оси (>= 2).
+    :param height: Количество точек по мнимой оси (>= 2).
+    :return: Список Complex по строкам (от im_max к im_min).
+    """
+    re_min, re_max = as_fraction(re_min), as_fraction(re_max)
+    im_min, im_max = as_fraction(im_min), as_fraction(im_max)
+    re_step = (re_max - re_min) / (width - 1)
+    im_step = (im_max - im_min) / (height - 1)
+    return [
+        Complex(re_min + re_step * x, im_max - im_step * y)
+        for y in range(height) for x in range(width)
+    ]
+
+
+def _lane(value):
+    """
+    Представление комплексного числа тройкой целых (re, im, знаменатель).
+    """
+    (pair,), denominator = scale_complexes([value])
+    return pair[0], pair[1], denominator
+
+
+def _reduce_lane(re, im, denominator):
+    """
+    Сокращение тройки (re, im, знаменатель) на общий НОД.
+    """
+    divisor = math.gcd(re, im, denominator)
+    if divisor > 1:
+        return re // divisor, im // divisor, denominator // divisor
+    return re, im, denominator
+
+
+def _round_lane(re, im, denominator, precision_bits):
+    """
+    Округление тройки к знаменателю 2^precision_bits, если текущий больше.
+    """
+    if denominator.bit_length() <= precision_bits:
+        return re, im, denominator
+    scale = 1 << precision_bits
+    twice = 2 * denominator
+    return (2 * re * scale + denominator) // twice, (2 * im * scale + denominator) // twice, scale
+
+
+def iterate_map(points, coefficients=(0, 0, 1), c=None, max_iter=100, bailout=2,
+                tolerance=None, precision_bits=None):
+    """
+    Пакетная итерация отображения z -> p(z) + c над сеткой точек.
+
+    Многочлен p задаётся коэффициентами [a0, a1, ..., ad]. Если c не задано,
+    каждая точка служит параметром c, а итерация начинается с нуля (режим
+    множества Мандельброта); иначе точка — начальное значение z0, а c общее
+    для всех (режим множества Жюлиа и поиск неподвижных точек).
+
+    Все значения хранятся как гауссовы целые с общим знаменателем, условие
+    ухода |z| > bailout проверяется по квадрату модуля без извлечения корня.
+    Завершившиеся точки исключаются из списка активных и больше не
+    вычисляются.
+
+    :param points: Последовательность Complex, Fraction, int или float.
+    :param coefficients: Коэффициенты многочлена p от младшего к старшему.
+    :param c: Общая константа c или None.
+    :param max_iter: Максимальное количество итераций.
+    :param bailout: Радиус ухода (Fraction, int или float).
+    :param tolerance: Если задано, точка завершается при |z_{k+1} - z_k| <= tolerance.
+    :param precision_bits: Если задано, знаменатели ограничиваются 2^precision_bits
+        округлением (режим ограниченной точности).
+    :return: Кортеж (список количеств итераций, список конечных значений Complex).
+    :raises ValueError: Если список коэффициентов пуст.
+    """
+    if not coefficients:
+        raise ValueError("Многочлен должен иметь хотя бы один коэффициент.")
+    pairs, coefficient_denominator = scale_complexes(coefficients)
+    degree = len(pairs) - 1
+    radius = as_fraction(bailout)
+    radius_num, radius_den = radius.numerator ** 2, radius.denominator ** 2
+    if tolerance is not None:
+        tolerance = as_fraction(tolerance)
+        tolerance_num, tolerance_den = tolerance.numerator ** 2, tolerance.denominator ** 2
+
+    lanes = [_lane(point) for point in points]
+    if c is None:
+        constants = lanes
+        lanes = [(0, 0, 1)] * len(constants)
+    else:
+        constants = [_lane(c)] * len(lanes)
+    counts = [max_iter] * len(lanes)
+    active = list(range(len(lanes)))
+
+    for iteration in range(max_iter):
+        still_active = []
+        for i in active:
+            re, im, den = lanes[i]
+            if (re * re + im * im) * radius_den > radius_num * den * den:
+                counts[i] = iteration
+                continue
+            # Схема Горнера: p(z) = N / (D_coef * den^degree)
+            acc_re, acc_im = pairs[degree]
+            power = 1
+            for k in range(degree - 1, -1, -1):
+                power *= den
+                acc_re, acc_im = (acc_re * re - acc_im * im + pairs[k][0] * power,
+                                  acc_re * im + acc_im * re + pairs[k][1] * power)
+            poly_den = coefficient_denominator * power
+            c_re, c_im, c_den = constants[i]
+            new = (acc_re * c_den + c_re * poly_den,
+                   acc_im * c_den + c_im * poly_den,
+                   poly_den * c_den)
+            new = _reduce_lane(*new)
+            if precision_bits is not None:
+                new = _round_lane(*new, precision_bits)
+            lanes[i] = new
+            if tolerance is not None:
+                diff_re = new[0] * den - re * new[2]
+                diff_im = new[1] * den - im * new[2]
+                scale = new[2] * den
+                if (diff_re * diff_re + diff_im * diff_im) * tolerance_den <= tolerance_num * scale * scale:
+                    counts[i] = iteration + 1
+                    continue
+            still_active.append(i)
+        active = still_active
+        if not active:
+            break
+
+    values = [gaussian_to_complex((re, im), den) for re, im, den in lanes]
+    return counts, values
+
+
+def escape_times(points, coefficients=(0, 0, 1), c=None, max_iter=100, bailout=2, precision_bits=None):
+    """
+    Количество итераций до ухода за радиус bailout для каждой точки.
+
+    :param points: Последовательность Complex, Fraction, int или float.
+    :param coefficients: Коэффициенты многочлена p от младшего к старшему.
+    :param c: Общая константа c или None (режим множества Мандельброта).
+    :param max_iter: Максимальное количество итераций.
+    :param bailout: Радиус ухода.
+    :param precision_bits: Необязательное ограничение знаменателей 2^precision_bits.
+    :return: Список целых чисел (max_iter для точек, не ушедших за радиус).
+    """
+    counts, _ = iterate_map(points, coefficients, c, max_iter, bailout, precision_bits=precision_bits)
+    return counts
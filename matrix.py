@@ -0,0 +1,428 @@
+import math
+import operator
+from fraction_class import Fraction
+from integer_scaling import (
+    as_fraction, as_complex, scale_fractions, scale_complexes,
+    gaussian_mul, gaussian_sub, gaussian_exact_div, gaussian_to_complex,
+)
+from number_theory import word_primes, rational_reconstruction
+
+# Количество простых модулей, по которым пробуется обратить матрицу перед
+# переходом к исключению Барейса (матрица может быть вырождена).
+_DIXON_ATTEMPTS = 3
+
+
+def _combine_integer_rows(row, pivot_row, pivot, factor, previous):
+    """
+    Шаг исключения Барейса для хвоста строки из целых чисел:
+    (pivot * row - factor * pivot_row) / previous, деление точное.
+    """
+    if factor == 0:
+        if pivot == previous:
+            return row
+        return [x * pivot // previous for x in row]
+    return [(x * pivot - factor * y) // previous for x, y in zip(row, pivot_row)]
+
+
+def _combine_gaussian_rows(row, pivot_row, pivot, factor, previous):
+    """
+    Шаг исключения Барейса для хвоста строки из гауссовых целых чисел (пар (re, im)).
+    """
+    if factor == (0, 0):
+        if pivot == previous:
+            return row
+        return [gaussian_exact_div(gaussian_mul(x, pivot), previous) for x in row]
+    return [
+        gaussian_exact_div(gaussian_sub(gaussian_mul(x, pivot), gaussian_mul(factor, y)), previous)
+        for x, y in zip(row, pivot_row)
+    ]
+
+
+def _fraction_free_reduce(rows, ncols, combine, zero, one):
+    """
+    Безфракционное прямое исключение (алгоритм Барейса).
+
+    Все промежуточные элементы являются минорами исходной матрицы, поэтому
+    деления выполняются нацело и знаменатели не растут. После исключения
+    матрица имеет ступенчатый вид, последний ведущий элемент равен
+    определителю (с учётом перестановок строк).
+
+    :param rows: Список строк (изменяется на месте).
+    :param ncols: Количество столбцов, в которых ищутся ведущие элементы.
+    :param combine: Функция шага исключения для хвоста строки.
+    :param zero: Нулевой элемент кольца.
+    :param one: Единичный элемент кольца.
+    :return: Кортеж (ранг, последний ведущий элемент, знак перестановки строк).
+    """
+    n = len(rows)
+    previous = one
+    sign = 1
+    rank = 0
+    for col in range(ncols):
+        if rank == n:
+            break
+        pivot_index = next((r for r in range(rank, n) if rows[r][col] != zero), None)
+        if pivot_index is None:
+            continue
+        if pivot_index != rank:
+            rows[rank], rows[pivot_index] = rows[pivot_index], rows[rank]
+            sign = -sign
+        pivot_row = rows[rank]
+        pivot = pivot_row[col]
+        pivot_tail = pivot_row[col + 1:]
+        for i in range(rank + 1, n):
+            row = rows[i]
+            tail = combine(row[col + 1:], pivot_tail, pivot, row[col], previous)
+            rows[i] = row[:col] + [zero] + tail
+        previous = pivot
+        rank += 1
+    return rank, previous, sign
+
+
+def _inverse_mod(rows, modulus):
+    """
+    Обратная матрица по простому модулю методом Гаусса — Жордана.
+
+    :return: Список строк или None, если матрица вырождена по модулю.
+    """
+    n = len(rows)
+    work = [[x % modulus for x in row] + [int(i == j) for j in range(n)] for i, row in enumerate(rows)]
+    for col in range(n):
+        pivot = next((r for r in range(col, n) if work[r][col]), None)
+        if pivot is None:
+            return None
+        work[col], work[pivot] = work[pivot], work[col]
+        inverse = pow(work[col][col], -1, modulus)
+        pivot_tail = [x * inverse % modulus for x in work[col][col:]]
+        work[col][col:] = pivot_tail
+        for r in range(n):
+            factor = work[r][col]
+            if r != col and factor:
+                work[r][col:] = [(x - factor * y) % modulus for x, y in zip(work[r][col:], pivot_tail)]
+    return [row[n:] for row in work]
+
+
+def _reconstruct_vector(values, modulus):
+    """
+    Рациональное восстановление вектора с общим знаменателем.
+
+    Каждый следующий остаток сначала умножается на уже найденный общий
+    знаменатель; обычно результат сразу оказывается малым целым, и полный
+    алгоритм Евклида запускается лишь для немногих компонент.
+
+    :return: Кортеж (список числителей, общий знаменатель) или None.
+    """
+    bound = math.isqrt(modulus // 2)
+    numerators = []
+    denominator = 1
+    for value in values:
+        scaled = value * denominator % modulus
+        if scaled > modulus // 2:
+            scaled -= modulus
+        if abs(scaled) <= bound:
+            numerators.append(scaled)
+            continue
+        pair = rational_reconstruction(scaled, modulus)
+        if pair is None:
+            return None
+        numerators = [x * pair[1] for x in numerators]
+        numerators.append(pair[0])
+        denominator *= pair[1]
+    return numerators, denominator
+
+
+def _dixon_solve(rows, rhs):
+    """
+    Решение невырожденной целочисленной системы p-адическим подъёмом Диксона.
+
+    Матрица обращается один раз по словному простому модулю p, после чего
+    решение уточняется цифрами по основанию p: каждая итерация стоит O(n²)
+    операций с числами ограниченной длины, а не O(n³) операций с растущими
+    минорами, как в исключении Барейса. Подъём продолжается, пока p^k не
+    превысит удвоенный квадрат границы Адамара расширенной матрицы, — этого
+    достаточно, чтобы рациональное восстановление дало точное решение.
+
+    :param rows: Квадратная матрица целых чисел.
+    :param rhs: Целочисленная правая часть.
+    :return: Кортеж (список числителей, общий знаменатель) или None, если
+             матрица оказалась вырожденной по всем пробным модулям.
+    """
+    primes = word_primes()
+    for _ in range(_DIXON_ATTEMPTS):
+        modulus = next(primes)
+        inverse = _inverse_mod(rows, modulus)
+        if inverse is not None:
+            break
+    else:
+        return None
+    # log2 границы Адамара для всех миноров расширенной матрицы [rows | rhs]
+    hadamard_bits = sum((sum(x * x for x in row) + y * y).bit_length() // 2 + 1 for row, y in zip(rows, rhs))
+    residual = list(rhs)
+    solution = [0] * len(rows)
+    power = 1
+    while power.bit_length() <= 2 * hadamard_bits + 1:
+        reduced = [r % modulus for r in residual]
+        digits = [sum(map(operator.mul, row, reduced)) % modulus for row in inverse]
+        residual = [(r - sum(map(operator.mul, row, digits))) // modulus for r, row in zip(residual, rows)]
+        solution = [x + d * power for x, d in zip(solution, digits)]
+        power *= modulus
+    return _reconstruct_vector(solution, power)
+
+
+class RationalMatrix:
+    """
+    Класс для точной линейной алгебры над дробями.
+
+    Определитель, обращение и ранг вычисляются безфракционным исключением
+    Барейса: каждая строка приводится к общему знаменателю, после чего работа
+    идёт только с целыми числителями. Системы решаются p-адическим подъёмом
+    Диксона по тем же целым строкам (с переходом к Барейсу для вырожденных матриц).
+
+    Атрибуты:
+        rows (list): Список строк матрицы (элементы — Fraction).
+    """
+
+    _zero = 0
+    _one = 1
+    _lift_solve = staticmethod(_dixon_solve)
+    _combine = staticmethod(_combine_integer_rows)
+    _mul = staticmethod(operator.mul)
+    _sub = staticmethod(operator.sub)
+    _exact_div = staticmethod(operator.floordiv)
+
+    def __init__(self, rows):
+        """
+        Инициализация матрицы.
+
+        :param rows: Список строк одинаковой длины (Fraction, int или float).
+        :raises ValueError: Если строки имеют разную длину.
+        """
+        self.rows = [[self._coerce(value) for value in row] for row in rows]
+        if any(len(row) != len(self.rows[0]) for row in self.rows):
+            raise ValueError("Все строки матрицы должны иметь одинаковую длину.")
+
+    @staticmethod
+    def _coerce(value):
+        """
+        Приводит элемент к типу матрицы.
+        """
+        return as_fraction(value)
+
+    @staticmethod
+    def _scale_row(row):
+        """
+        Приводит строку к целым числителям с общим знаменателем.
+        """
+        return scale_fractions(row)
+
+    @staticmethod
+    def _ring_integer(value):
+        """
+        Вложение целого числа в кольцо, над которым идёт исключение.
+        """
+        return value
+
+    @staticmethod
+    def _negate(value):
+        """
+        Противоположный элемент кольца.
+        """
+        return -value
+
+    @staticmethod
+    def _quotient(numerator, denominator):
+        """
+        Переводит частное элементов кольца обратно в элемент матрицы.
+        """
+        return Fraction(numerator, denominator)
+
+    @property
+    def shape(self):
+        """
+        Размеры матрицы.
+
+        :return: Кортеж (число строк, число столбцов).
+        """
+        return len(self.rows), len(self.rows[0]) if self.rows else 0
+
+    def __getitem__(self, index):
+        """
+        Доступ к элементу по паре индексов или к строке по одному индексу.
+        """
+        if isinstance(index, tuple):
+            i, j = index
+            return self.rows[i][j]
+        return self.rows[index]
+
+    def __eq__(self, other):
+        """
+        Проверка на равенство двух матриц.
+        """
+        if not isinstance(other, RationalMatrix):
+            return NotImplemented
+        return self.rows == other.rows
+
+    def __ne__(self, other):
+        """
+        Проверка на неравенство двух матриц.
+        """
+        return not self.__eq__(other)
+
+    def __repr__(self):
+        """
+        Представление для отладки.
+        """
+        return f"{type(self).__name__}({self.rows!r})"
+
+    def _require_square(self):
+        """
+        :raises ValueError: Если матрица не квадратная.
+        """
+        rows, cols = self.shape
+        if rows != cols:
+            raise ValueError("Матрица должна быть квадратной.")
+        return rows
+
+    def _reduce(self, rows, ncols):
+        """
+        Масштабирует строки к целым числам и выполняет исключение Барейса.
+
+        :return: Кортеж (целые строки, ранг, последний ведущий элемент,
+                 знак перестановки, произведение масштабов строк).
+        """
+        scaled = []
+        scale_product = 1
+        for row in rows:
+            integers, denominator = self._scale_row(row)
+            scaled.append(integers)
+            scale_product *= denominator
+        rank, pivot, sign = _fraction_free_reduce(scaled, ncols, self._combine, self._zero, self._one)
+        return scaled, rank, pivot, sign, scale_product
+
+    def _back_substitute(self, rows, column, determinant):
+        """
+        Безфракционная обратная подстановка для треугольной системы.
+
+        Возвращает числители y решения x = y / determinant; по правилу Крамера
+        они являются элементами кольца, поэтому все деления точные.
+
+        :param rows: Строки после прямого исключения.
+        :param column: Индекс столбца правой части.
+        :param determinant: Последний ведущий элемент исключения.
+        :return: Список числителей решения.
+        """
+        n = len(rows)
+        result = [self._zero] * n
+        for i in range(n - 1, -1, -1):
+            row = rows[i]
+            acc = self._mul(determinant, row[column])
+            for j in range(i + 1, n):
+                acc = self._sub(acc, self._mul(row[j], result[j]))
+            result[i] = self._exact_div(acc, row[i])
+        return result
+
+    def rank(self):
+        """
+        Ранг матрицы.
+
+        :return: Целое число.
+        """
+        _, rank, _, _, _ = self._reduce(self.rows, self.shape[1])
+        return rank
+
+    def determinant(self):
+        """
+        Определитель матрицы.
+
+        :return: Определитель (Fraction для RationalMatrix, Complex для ComplexMatrix).
+        :raises ValueError: Если матрица не квадратная.
+        """
+        n = self._require_square()
+        _, rank, pivot, sign, scale_product = self._reduce(self.rows, n)
+        if rank < n:
+            return self._coerce(0)
+        if sign < 0:
+            pivot = self._negate(pivot)
+        return self._quotient(pivot, self._ring_integer(scale_product))
+
+    def solve(self, b):
+        """
+        Решение системы A x = b.
+
+        :param b: Вектор правой части (список элементов).
+        :return: Список компонент решения.
+        :raises ValueError: Если матрица не квадратная, вырождена или размеры не совпадают.
+        """
+        n = self._require_square()
+        if len(b) != n:
+            raise ValueError("Размер правой части не совпадает с размером матрицы.")
+        augmented = [row + [self._coerce(value)] for row, value in zip(self.rows, b)]
+        if self._lift_solve is not None:
+            scaled = [self._scale_row(row)[0] for row in augmented]
+            lifted = self._lift_solve([row[:n] for row in scaled], [row[n] for row in scaled])
+            if lifted is not None:
+                numerators, denominator = lifted
+                return [self._quotient(y, denominator) for y in numerators]
+        scaled, rank, pivot, _, _ = self._reduce(augmented, n)
+        if rank < n:
+            raise ValueError("Матрица вырождена.")
+        return [self._quotient(y, pivot) for y in self._back_substitute(scaled, n, pivot)]
+
+    def inverse(self):
+        """
+        Обратная матрица.
+
+        :return: Новая матрица того же типа.
+        :raises ValueError: Если матрица не квадратная или вырождена.
+        """
+        n = self._require_square()
+        zero, one = self._coerce(0), self._coerce(1)
+        augmented = [
+            row + [one if i == j else zero for j in range(n)]
+            for i, row in enumerate(self.rows)
+        ]
+        scaled, rank, pivot, _, _ = self._reduce(augmented, n)
+        if rank < n:
+            raise ValueError("Матрица вырождена.")
+        columns = [self._back_substitute(scaled, n + k, pivot) for k in range(n)]
+        return type(self)([[self._quotient(column[i], pivot) for column in columns] for i in range(n)])
+
+
+class ComplexMatrix(RationalMatrix):
+    """
+    Класс для точной линейной алгебры над комплексными числами с рациональными частями.
+
+    Строки приводятся к гауссовым целым числам с общим знаменателем, исключение
+    Барейса выполняется в кольце гауссовых целых.
+
+    Атрибуты:
+        rows (list): Список строк матрицы (элементы — Complex).
+    """
+
+    _zero = (0, 0)
+    _one = (1, 0)
+    _lift_solve = None
+    _combine = staticmethod(_combine_gaussian_rows)
+    _mul = staticmethod(gaussian_mul)
+    _sub = staticmethod(gaussian_sub)
+    _exact_div = staticmethod(gaussian_exact_div)
+
+    @staticmethod
+    def _coerce(value):
+        return as_complex(value)
+
+    @staticmethod
+    def _scale_row(row):
+        return scale_complexes(row)
+
+    @staticmethod
+    def _ring_integer(value):
+        return value, 0
+
+    @staticmethod
+    def _negate(value):
+        return -value[0], -value[1]
+
+    @staticmethod
+    def _quotient(numerator, denominator):
+        return gaussian_to_complex(numerator, denominator)
@@ -0,0 +1,208 @@
+from itertools import islice
+from fraction_class import Fraction
+from complex import Complex
+from integer_scaling import as_fraction
+from number_theory import word_primes, crt_combine, rational_reconstruction
+
+
+def reduce_mod(value, modulus):
+    """
+    Образ числа в поле вычетов по простому модулю.
+
+    :param value: Fraction, int, float или Complex (а также списки и кортежи из них).
+    :param modulus: Простой модуль.
+    :return: Вычет; для Complex — пара (re, im); для списков — список образов.
+    :raises ZeroDivisionError: Если знаменатель делится на модуль.
+    """
+    if isinstance(value, (list, tuple)):
+        return [reduce_mod(item, modulus) for item in value]
+    if isinstance(value, Complex):
+        return reduce_mod(value.real, modulus), reduce_mod(value.imag, modulus)
+    value = as_fraction(value)
+    if value.denominator % modulus == 0:
+        raise ZeroDivisionError("Знаменатель делится на модуль.")
+    return value.numerator * pow(value.denominator, -1, modulus) % modulus
+
+
+def gaussian_mul_mod(a, b, modulus):
+    """
+    Произведение гауссовых чисел (re, im) по модулю.
+    """
+    return (a[0] * b[0] - a[1] * b[1]) % modulus, (a[0] * b[1] + a[1] * b[0]) % modulus
+
+
+def _evaluate_at(function, modulus, args):
+    """
+    Вычисление функции по одному модулю; None для «неудачного» модуля.
+
+    Неудачным считается только модуль, делящий знаменатель аргумента;
+    исключения самой функции не перехватываются.
+    """
+    try:
+        reduced = [reduce_mod(arg, modulus) for arg in args]
+    except ZeroDivisionError:
+        return None
+    return function(modulus, *reduced)
+
+
+def _reconstruct(residues, modulus):
+    """
+    Рациональное восстановление каждой компоненты результата.
+    """
+    parts = []
+    for residue in residues:
+        pair = rational_reconstruction(residue, modulus)
+        if pair is None:
+            return None
+        parts.append(Fraction(*pair))
+    return parts
+
+
+def modular_evaluate(function, *args, executor=None, batch_size=4, max_primes=256, verify=None):
+    """
+    Точное вычисление через остатки по многим простым модулям.
+
+    Функция вызывается как function(p, *args_mod_p) для простых p < 2^62 и
+    возвращает вычет (или пару вычетов (re, im) для комплексного результата).
+    Остатки объединяются китайской теоремой об остатках, после чего
+    дробь восстанавливается рационально. Ответ принимается, когда
+    восстановление перестаёт меняться, и дополнительно проверяется по
+    свежему простому модулю (и функцией verify, если она задана).
+
+    :param function: Функция вычисления по модулю (для процессного executor — сериализуемая).
+    :param args: Аргументы: Fraction, int, float, Complex или списки из них.
+    :param executor: Необязательный concurrent.futures.Executor для параллельных вычислений.
+    :param batch_size: Количество модулей, обрабатываемых за один шаг.
+    :param max_primes: Максимальное количество используемых модулей.
+    :param verify: Необязательная функция проверки кандидата (возвращает bool).
+    :return: Fraction или Complex.
+    :raises ValueError: Если результат не удалось восстановить.
+    """
+    primes = word_primes()
+    residues, modulus = None, 1
+    previous = None
+    used = 0
+    while used < max_primes:
+        batch = list(islice(primes, batch_size))
+        used += len(batch)
+        if executor is not None:
+            values = list(executor.map(_evaluate_at, [function] * len(batch), batch, [args] * len(batch)))
+        else:
+            values = [_evaluate_at(function, p, args) for p in batch]
+        for p, value in zip(batch, values):
+            if value is None:
+                continue
+            value = value if isinstance(value, tuple) else (value,)
+            if residues is None:
+                residues = list(value)
+                modulus = p
+                continue
+            combined = [crt_combine(r, modulus, v, p)[0] for r, v in zip(residues, value)]
+            residues, modulus = combined, modulus * p
+        if residues is None:
+            continue
+        candidate = _reconstruct(residues, modulus)
+        if candidate is None or candidate != previous:
+            previous = candidate
+            continue
+        check = expected = None
+        while check is None and used < max_primes:  # неудачный проверочный модуль заменяется следующим
+            check_prime = next(primes)
+            used += 1
+            try:
+                expected = [reduce_mod(part, check_prime) for part in candidate]
+            except ZeroDivisionError:
+                continue
+            check = _evaluate_at(function, check_prime, args)
+        if check is None:
+            break
+        check = check if isinstance(check, tuple) else (check,)
+        if list(check) != expected:
+            previous = None
+            continue
+        result = candidate[0] if len(candidate) == 1 else Complex(*candidate)
+        if verify is None or verify(result):
+            return result
+        previous = None
+    raise ValueError("Не удалось восстановить результат: увеличьте max_primes.")
+
+
+def _product_mod(modulus, values):
+    """
+    Произведение вычетов.
+    """
+    result = 1
+    for value in values:
+        result = result * value % modulus
+    return result
+
+
+def _polyval_mod(modulus, coefficients, x):
+    """
+    Значение многочлена (коэффициенты от старшего к младшему) по схеме Горнера.
+    """
+    result = 0
+    for coefficient in coefficients:
+        result = (result * x + coefficient) % modulus
+    return result
+
+
+def _determinant_mod(modulus, rows):
+    """
+    Определитель матрицы вычетов методом Гаусса.
+    """
+    rows = [list(row) for row in rows]
+    n = len(rows)
+    determinant = 1
+    for col in range(n):
+        pivot = next((r for r in range(col, n) if rows[r][col]), None)
+        if pivot is None:
+            return 0
+        if pivot != col:
+            rows[col], rows[pivot] = rows[pivot], rows[col]
+            determinant = -determinant
+        pivot_value = rows[col][col]
+        determinant = determinant * pivot_value % modulus
+        inverse = pow(pivot_value, -1, modulus)
+        for r in range(col + 1, n):
+            factor = rows[r][col] * inverse % modulus
+            if factor:
+                rows[r] = [(x - factor * y) % modulus for x, y in zip(rows[r], rows[col])]
+    return determinant % modulus
+
+
+def modular_product(values, **options):
+    """
+    Точное произведение последовательности дробей через остатки.
+
+    :param values: Последовательность Fraction, int или float.
+    :param options: Параметры modular_evaluate (executor, batch_size, max_primes, verify).
+    :return: Fraction.
+    """
+    return modular_evaluate(_product_mod, list(values), **options)
+
+
+def modular_polyval(coefficients, x, **options):
+    """
+    Точное значение многочлена с дробными коэффициентами через остатки.
+
+    :param coefficients: Коэффициенты от старшего к младшему.
+    :param x: Точка (Fraction, int или float).
+    :param options: Параметры modular_evaluate.
+    :return: Fraction.
+    """
+    return modular_evaluate(_polyval_mod, list(coefficients), x, **options)
+
+
+def modular_determinant(rows, **options):
+    """
+    Точный определитель квадратной матрицы дробей через остатки.
+
+    :param rows: Список строк (Fraction, int или float).
+    :param options: Параметры modular_evaluate.
+    :return: Fraction.
+    :raises ValueError: Если матрица не квадратная.
+    """
+    if any(len(row) != len(rows) for row in rows):
+        raise ValueError("Матрица должна быть квадратной.")
+    return modular_evaluate(_determinant_mod, [list(row) for row in rows], **options)
@@ -0,0 +1,109 @@
+import math
+
+_SMALL_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+
+def is_probable_prime(n):
+    """
+    Проверка числа на простоту тестом Миллера–Рабина.
+
+    Для n < 3.3 * 10^24 набор оснований делает тест детерминированным,
+    для больших n вероятность ошибки не превышает 4^-13.
+
+    :param n: Целое число.
+    :return: True, если n простое (или вероятно простое), иначе False.
+    """
+    if n < 2:
+        return False
+    for p in _SMALL_PRIMES:
+        if n % p == 0:
+            return n == p
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for a in _SMALL_PRIMES:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def root_of_unity(modulus, order, cofactor):
+    """
+    Поиск корня из единицы заданного порядка по простому модулю.
+
+    :param modulus: Простой модуль вида cofactor * order + 1.
+    :param order: Порядок корня (степень двойки).
+    :param cofactor: Множитель cofactor = (modulus - 1) / order.
+    :return: Элемент, порядок которого ровно order.
+    """
+    if order == 1:
+        return 1
+    for g in range(2, modulus):
+        w = pow(g, cofactor, modulus)
+        if pow(w, order // 2, modulus) == modulus - 1:
+            return w
+    raise ValueError("Корень из единицы заданного порядка не существует.")
+
+
+# Простые числа чуть меньше 2^62, найденные при предыдущих вызовах word_primes.
+_WORD_PRIMES = []
+
+
+def word_primes():
+    """
+    Бесконечная последовательность простых чисел машинного размера (меньше 2^62)
+    в порядке убывания; найденные простые кэшируются между вызовами.
+
+    :return: Генератор целых чисел.
+    """
+    index = 0
+    while True:
+        if index == len(_WORD_PRIMES):
+            candidate = _WORD_PRIMES[-1] - 2 if _WORD_PRIMES else (1 << 62) - 1
+            while not is_probable_prime(candidate):
+                candidate -= 2
+            _WORD_PRIMES.append(candidate)
+        yield _WORD_PRIMES[index]
+        index += 1
+
+
+def crt_combine(residue, modulus, other_residue, other_modulus):
+    """
+    Китайская теорема об остатках для двух взаимно простых модулей.
+
+    :return: Кортеж (остаток, произведение модулей).
+    """
+    inverse = pow(modulus, -1, other_modulus)
+    step = (other_residue - residue) * inverse % other_modulus
+    return residue + modulus * step, modulus * other_modulus
+
+
+def rational_reconstruction(residue, modulus):
+    """
+    Восстановление дроби n/d по остатку n * d^-1 mod modulus.
+
+    Ищется дробь с |n|, d <= sqrt(modulus / 2) расширенным алгоритмом Евклида,
+    остановленным на половине; такая дробь единственна.
+
+    :param residue: Остаток.
+    :param modulus: Модуль.
+    :return: Кортеж (числитель, знаменатель) или None, если дробь не найдена.
+    """
+    bound = math.isqrt(modulus // 2)
+    r0, r1 = modulus, residue % modulus
+    s0, s1 = 0, 1
+    while r1 > bound:
+        quotient = r0 // r1
+        r0, r1 = r1, r0 - quotient * r1
+        s0, s1 = s1, s0 - quotient * s1
+    if s1 == 0 or abs(s1) > bound or math.gcd(r1, s1) != 1:
+        return None
+    return (r1, s1) if s1 > 0 else (-r1, -s1)
@@ -0,0 +1,265 @@
+import cmath
+import math
+import int_backend
+from fraction_class import Fraction
+from complex import Complex
+
+
+def _normalize_angle(angle):
+    """
+    Приводит угол к промежутку (-π, π].
+    """
+    angle = math.remainder(angle, 2 * math.pi)
+    return math.pi if angle == -math.pi else angle
+
+
+class PolarComplex:
+    """
+    Комплексное число в полярной форме для задач с большим числом умножений,
+    делений и возведений в степень.
+
+    Модуль и аргумент хранятся как float, поэтому умножение — это одно
+    произведение и одна сумма. Преобразования в Complex и обратно выполняются
+    лениво и кэшируются. Так как полярная форма неточна, равенство по
+    умолчанию проверяется с допуском.
+
+    Атрибуты:
+        modulus (float): Модуль числа.
+        angle (float): Аргумент в радианах, в промежутке (-π, π].
+        rel_tol (float): Относительный допуск при сравнении на равенство.
+        abs_tol (float): Абсолютный допуск при сравнении на равенство.
+    """
+
+    rel_tol = 1e-9
+    abs_tol = 0.0
+
+    def __init__(self, modulus, angle=0.0):
+        """
+        Инициализация числа по модулю и аргументу.
+
+        :param modulus: Модуль (неотрицательное число).
+        :param angle: Аргумент в радианах.
+        :raises ValueError: Если модуль отрицателен.
+        """
+        modulus = float(modulus)
+        if modulus < 0:
+            raise ValueError("Модуль не может быть отрицательным.")
+        self._modulus = modulus
+        self._angle = _normalize_angle(float(angle))
+        self._complex = None
+        self._exact = False
+
+    @classmethod
+    def from_complex(cls, value):
+        """
+        Создает PolarComplex из Complex; модуль и аргумент вычисляются лениво.
+
+        :param value: Комплексное число (Complex).
+        :return: Объект PolarComplex.
+        :raises TypeError: Если value не является Complex.
+        """
+        if not isinstance(value, Complex):
+            raise TypeError("Ожидается комплексное число.")
+        result = cls.__new__(cls)
+        result._modulus = None
+        result._angle = None
+        result._complex = Complex(value.real, value.imag)
+        result._exact = True
+        return result
+
+    @classmethod
+    def _coerce(cls, other):
+        """
+        Приводит операнд к PolarComplex или возвращает None.
+        """
+        if isinstance(other, PolarComplex):
+            return other
+        if isinstance(other, Complex):
+            return cls.from_complex(other)
+        if isinstance(other, int_backend.INTEGER_TYPES + (float, Fraction)):
+            value = float(other)
+            return cls(abs(value), math.pi if value < 0 else 0.0)
+        return None
+
+    @staticmethod
+    def _exact_value(value):
+        """
+        Точное значение операнда в виде Complex или None, если оно известно лишь приближённо.
+
+        Точными считаются Complex, Fraction, целые числа и PolarComplex,
+        созданные методом from_complex.
+        """
+        if isinstance(value, PolarComplex):
+            return value._complex if value._exact else None
+        if isinstance(value, Complex):
+            return value
+        if isinstance(value, int_backend.INTEGER_TYPES + (Fraction,)):
+            return Complex(value)
+        return None
+
+    @property
+    def modulus(self):
+        """
+        Модуль числа (вычисляется при первом обращении).
+
+        :return: float.
+        """
+        if self._modulus is None:
+            self._modulus = abs(self._complex)
+        return self._modulus
+
+    @property
+    def angle(self):
+        """
+        Аргумент числа (вычисляется при первом обращении).
+
+        :return: float.
+        """
+        if self._angle is None:
+            self._angle = self._complex.arg()
+        return self._angle
+
+    def to_complex(self):
+        """
+        Преобразование в Complex (результат кэшируется).
+
+        :return: Новое комплексное число.
+        """
+        if self._complex is None:
+            value = cmath.rect(self.modulus, self.angle)
+            self._complex = Complex(value.real, value.imag)
+        return Complex(self._complex.real, self._complex.imag)
+
+    def __complex__(self):
+        """
+        Преобразование во встроенный complex.
+        """
+        return cmath.rect(self.modulus, self.angle)
+
+    def __mul__(self, other):
+        """
+        Умножение: модули перемножаются, аргументы складываются.
+
+        :param other: PolarComplex, Complex, Fraction, int или float.
+        :return: Новый PolarComplex.
+        """
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
+        return PolarComplex(self.modulus * other.modulus, self.angle + other.angle)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        """
+        Деление: модули делятся, аргументы вычитаются.
+
+        :param other: PolarComplex, Complex, Fraction, int или float.
+        :return: Новый PolarComplex.
+        :raises ZeroDivisionError: Если other равен нулю.
+        """
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
+        if other.modulus == 0:
+            raise ZeroDivisionError("Нельзя делить на ноль.")
+        return PolarComplex(self.modulus / other.modulus, self.angle - other.angle)
+
+    def __rtruediv__(self, other):
+        """
+        Деление числа на PolarComplex.
+        """
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
+        return other / self
+
+    def __pow__(self, power):
+        """
+        Возведение в степень по формуле Муавра.
+
+        :param power: Степень (int, float или Fraction).
+        :return: Новый PolarComplex.
+        :raises TypeError: Если степень не является числом.
+        :raises ZeroDivisionError: Если ноль возводится в отрицательную степень.
+        """
+        if not isinstance(power, int_backend.INTEGER_TYPES + (float, Fraction)):
+            raise TypeError("Степень должна быть числом.")
+        power = float(power)
+        if self.modulus == 0:
+            if power < 0:
+                raise ZeroDivisionError("Нельзя возводить ноль в отрицательную степень.")
+            return PolarComplex(1.0 if power == 0 else 0.0)
+        return PolarComplex(self.modulus ** power, self.angle * power)
+
+    def __neg__(self):
+        """
+        Унарный минус: поворот на π.
+        """
+        return PolarComplex(self.modulus, self.angle + math.pi)
+
+    def __abs__(self):
+        """
+        Модуль числа.
+
+        :return: float.
+        """
+        return self.modulus
+
+    def conjugate(self):
+        """
+        Сопряженное число.
+
+        :return: Новый PolarComplex.
+        """
+        return PolarComplex(self.modulus, -self.angle)
+
+    def is_close(self, other, rel_tol=None, abs_tol=None):
+        """
+        Сравнение с допуском по расстоянию на комплексной плоскости.
+
+        При нулевых допусках точно известные значения (см. _exact_value)
+        сравниваются точно, без перехода к float.
+
+        :param other: PolarComplex, Complex, Fraction, int или float.
+        :param rel_tol: Относительный допуск (по умолчанию — атрибут класса).
+        :param abs_tol: Абсолютный допуск (по умолчанию — атрибут класса).
+        :return: True, если числа близки, иначе False.
+        """
+        rel_tol = self.rel_tol if rel_tol is None else rel_tol
+        abs_tol = self.abs_tol if abs_tol is None else abs_tol
+        if rel_tol == 0 and abs_tol == 0:
+            exact, other_exact = self._exact_value(self), self._exact_value(other)
+            if exact is not None and other_exact is not None:
+                return exact == other_exact
+        other = self._coerce(other)
+        if other is None:
+            return False
+        distance = abs(complex(self) - complex(other))
+        return distance <= max(rel_tol * max(self.modulus, other.modulus), abs_tol)
+
+    def __eq__(self, other):
+        """
+        Проверка на равенство с допуском rel_tol/abs_tol.
+
+        При rel_tol = abs_tol = 0 сравнение точное, если оба значения известны
+        точно (см. _exact_value); иначе сравниваются приближения float.
+        """
+        if self._coerce(other) is None:
+            return NotImplemented
+        return self.is_close(other)
+
+    def __ne__(self, other):
+        """
+        Проверка на неравенство.
+        """
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def __repr__(self):
+        """
+        Представление для отладки.
+
+        :return: Строка в формате "PolarComplex(modulus, angle)".
+        """
+        return f"PolarComplex({self.modulus!r}, {self.angle!r})"
@@ -0,0 +1,173 @@
+import operator
+from collections import namedtuple
+from fraction_class import Fraction
+from complex import Complex
+from integer_scaling import scale_fractions, scale_complexes, gaussian_mul, gaussian_to_complex
+
+# Операции кольца коэффициентов: целые числа или гауссовы целые (пары (re, im)).
+_Ring = namedtuple("_Ring", "zero one add mul lift")
+
+
+def _gaussian_add(a, b):
+    """
+    Сумма гауссовых целых чисел, заданных парами (re, im).
+    """
+    return a[0] + b[0], a[1] + b[1]
+
+
+_INTEGERS = _Ring(0, 1, operator.add, operator.mul, lambda value: value)
+_GAUSSIAN_INTEGERS = _Ring((0, 0), (1, 0), _gaussian_add, gaussian_mul, lambda value: (value, 0))
+
+
+def _mulmod(p, q, modulus, ring):
+    """
+    Произведение многочленов p * q по модулю унитарного многочлена
+    y^k - m_1 y^(k-1) - ... - m_k, заданного списком [m_1, ..., m_k].
+
+    Многочлены — списки из k коэффициентов от младшего к старшему.
+    """
+    zero, add, mul = ring.zero, ring.add, ring.mul
+    k = len(modulus)
+    product = [zero] * (2 * k - 1)
+    for i, a in enumerate(p):
+        if a != zero:
+            for j, b in enumerate(q):
+                product[i + j] = add(product[i + j], mul(a, b))
+    for j in range(2 * k - 2, k - 1, -1):
+        top = product[j]
+        if top != zero:
+            for i, m in enumerate(modulus, 1):
+                product[j - i] = add(product[j - i], mul(top, m))
+    return product[:k]
+
+
+def _shift(p, modulus, ring):
+    """
+    Умножение многочлена на y по модулю (за O(k)).
+    """
+    k = len(modulus)
+    top = p[-1]
+    result = [ring.zero] + p[:-1]
+    if top != ring.zero:
+        for i, m in enumerate(modulus, 1):
+            result[k - i] = ring.add(result[k - i], ring.mul(top, m))
+    return result
+
+
+def _power_mod(n, modulus, ring):
+    """
+    Остаток y^n по модулю бинарным возведением в степень: O(k² log n).
+    """
+    result = [ring.one] + [ring.zero] * (len(modulus) - 1)
+    for bit in bin(n)[2:]:
+        result = _mulmod(result, result, modulus, ring)
+        if bit == "1":
+            result = _shift(result, modulus, ring)
+    return result
+
+
+def _prepare(coefficients, initial):
+    """
+    Приведение рекуррентности к целочисленной.
+
+    Пусть c_i = C_i / D и a_j = A_j / E с общими знаменателями D и E.
+    Тогда b_m = a_m * D^m * E — целые (гауссовы) числа с рекуррентностью
+    b_m = Σ C_i D^(i-1) b_(m-i) с целыми коэффициентами.
+
+    :return: Кортеж (кольцо, коэффициенты m_i, начальные b_j, D, E, признак комплексности).
+    :raises ValueError: Если списки пусты или их длины различаются.
+    """
+    if not coefficients or len(coefficients) != len(initial):
+        raise ValueError("Количество коэффициентов и начальных значений должно совпадать и быть положительным.")
+    is_complex = any(isinstance(value, Complex) for value in list(coefficients) + list(initial))
+    if is_complex:
+        ring = _GAUSSIAN_INTEGERS
+        scaled_coefficients, coefficient_denominator = scale_complexes(coefficients)
+        scaled_initial, initial_denominator = scale_complexes(initial)
+    else:
+        ring = _INTEGERS
+        scaled_coefficients, coefficient_denominator = scale_fractions(coefficients)
+        scaled_initial, initial_denominator = scale_fractions(initial)
+    modulus = []
+    power = 1
+    for value in scaled_coefficients:
+        modulus.append(ring.mul(value, ring.lift(power)))
+        power *= coefficient_denominator
+    start = []
+    power = 1
+    for value in scaled_initial:
+        start.append(ring.mul(value, ring.lift(power)))
+        power *= coefficient_denominator
+    return ring, modulus, start, coefficient_denominator, initial_denominator, is_complex
+
+
+def _combine(remainder, start, ring):
+    """
+    Значение Σ r_l b_l для остатка r.
+    """
+    total = ring.zero
+    for r, b in zip(remainder, start):
+        if r != ring.zero:
+            total = ring.add(total, ring.mul(r, b))
+    return total
+
+
+def recurrence_terms(coefficients, initial, start, count):
+    """
+    Блок членов линейной рекуррентной последовательности
+    a_m = c_1 a_(m-1) + c_2 a_(m-2) + ... + c_k a_(m-k).
+
+    Коэффициенты и начальные значения приводятся к общим знаменателям, и
+    вычисления ведутся над целыми (гауссовыми) числами. Первые k членов блока
+    находятся методом Китамасы — остаток y^start по модулю характеристического
+    многочлена за O(k² log start), — а остальные последовательно по
+    рекуррентности за O(k) операций на член.
+
+    :param coefficients: Коэффициенты [c_1, ..., c_k] (Fraction, Complex, int или float).
+    :param initial: Начальные значения [a_0, ..., a_(k-1)].
+    :param start: Номер первого члена блока (>= 0).
+    :param count: Количество членов (>= 0).
+    :return: Список Fraction (или Complex, если есть комплексные данные).
+    :raises ValueError: Если длины списков различаются или start, count отрицательны.
+    """
+    if start < 0 or count < 0:
+        raise ValueError("Номер и количество членов не могут быть отрицательными.")
+    ring, modulus, base, d, e, is_complex = _prepare(coefficients, initial)
+    k = len(modulus)
+
+    window = []
+    remainder = _power_mod(start, modulus, ring)
+    for j in range(min(count, k)):
+        if j:
+            remainder = _shift(remainder, modulus, ring)
+        window.append(_combine(remainder, base, ring))
+    for _ in range(k, count):
+        total = ring.zero
+        for m, b in zip(modulus, reversed(window[-k:])):
+            total = ring.add(total, ring.mul(m, b))
+        window.append(total)
+
+    result = []
+    denominator = d ** start * e
+    for value in window:
+        if is_complex:
+            result.append(gaussian_to_complex(value, denominator))
+        else:
+            result.append(Fraction(value, denominator))
+        denominator *= d
+    return result
+
+
+def linear_recurrence(coefficients, initial, n):
+    """
+    n-й член линейной рекуррентной последовательности за O(k² log n).
+
+    Например, числа Фибоначчи: linear_recurrence([1, 1], [0, 1], n).
+
+    :param coefficients: Коэффициенты [c_1, ..., c_k] (Fraction, Complex, int или float).
+    :param initial: Начальные значения [a_0, ..., a_(k-1)].
+    :param n: Номер члена (>= 0).
+    :return: Fraction (или Complex, если есть комплексные данные).
+    :raises ValueError: Если длины списков различаются или n отрицательно.
+    """
+    return recurrence_terms(coefficients, initial, n, 1)[0]
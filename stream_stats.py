@@ -0,0 +1,256 @@
+import math
+from bisect import bisect_right
+from fraction_class import Fraction
+from complex import Complex
+from integer_scaling import as_fraction
+
+
+def _accumulate(numerator, denominator, other_numerator, other_denominator):
+    """
+    Сложение несокращённых дробей numerator/denominator + other_numerator/other_denominator.
+
+    Если знаменатель суммы уже делится на знаменатель слагаемого (частый
+    случай общих знаменателей), знаменатель не растёт; НОД не вычисляется.
+    """
+    if denominator % other_denominator == 0:
+        return numerator + other_numerator * (denominator // other_denominator), denominator
+    return numerator * other_denominator + other_numerator * denominator, denominator * other_denominator
+
+
+def _copy(value):
+    """
+    Независимая копия дроби (исходный объект может быть изменён на месте).
+    """
+    return Fraction._from_reduced(value.numerator, value.denominator)
+
+
+class StreamStats:
+    """
+    Потоковый агрегатор точной статистики по Fraction и Complex.
+
+    Значения не сохраняются: хранятся только количество и несокращённые
+    суммы (Σz и Σ|z|²) в виде целых числителей с общими знаменателями.
+    Сокращение выполняется раз в normalize_every добавлений. Частичные
+    агрегаты (например, по шардам) объединяются методом merge.
+
+    Минимум, максимум и гистограмма определены только для действительных
+    значений.
+
+    Атрибуты:
+        count (int): Количество добавленных значений.
+        edges (list | None): Границы интервалов гистограммы.
+        normalize_every (int): Период сокращения накопленных сумм.
+    """
+
+    normalize_every = 64
+
+    def __init__(self, edges=None):
+        """
+        Инициализация пустого агрегатора.
+
+        :param edges: Необязательные возрастающие границы интервалов гистограммы.
+        :raises ValueError: Если границы не возрастают.
+        """
+        self.count = 0
+        self._re, self._im, self._den = 0, 0, 1
+        self._square, self._square_den = 0, 1
+        self._pending = 0
+        self._complex = False
+        self._min = self._max = None
+        self.edges = None
+        self._bins = None
+        if edges is not None:
+            self.edges = [_copy(as_fraction(edge)) for edge in edges]
+            if any(a >= b for a, b in zip(self.edges, self.edges[1:])):
+                raise ValueError("Границы гистограммы должны возрастать.")
+            self._bins = [0] * (len(self.edges) + 1)
+
+    def add(self, value):
+        """
+        Добавление одного значения.
+
+        :param value: Fraction, Complex, int или float.
+        :raises TypeError: Если комплексное значение добавляется при заданной гистограмме.
+        """
+        if isinstance(value, Complex):
+            if self._bins is not None:
+                raise TypeError("Гистограмма определена только для действительных значений.")
+            self._complex = True
+            re, im = value.real, value.imag
+            denominator = re.denominator * im.denominator // math.gcd(re.denominator, im.denominator)
+            a = re.numerator * (denominator // re.denominator)
+            b = im.numerator * (denominator // im.denominator)
+        else:
+            value = as_fraction(value)
+            denominator = value.denominator
+            a, b = value.numerator, 0
+            if not self._complex:
+                if self._min is None or value < self._min:
+                    self._min = _copy(value)
+                if self._max is None or value > self._max:
+                    self._max = _copy(value)
+            if self._bins is not None:
+                self._bins[bisect_right(self.edges, value)] += 1
+
+        self.count += 1
+        if self._den % denominator == 0:
+            scale = self._den // denominator
+            self._re += a * scale
+            self._im += b * scale
+        else:
+            self._re = self._re * denominator + a * self._den
+            self._im = self._im * denominator + b * self._den
+            self._den *= denominator
+        self._square, self._square_den = _accumulate(
+            self._square, self._square_den, a * a + b * b, denominator * denominator)
+        self._pending += 1
+        if self._pending >= self.normalize_every:
+            self._normalize()
+
+    def update(self, values):
+        """
+        Добавление всех значений итерируемого объекта.
+
+        :param values: Итерируемый объект (в том числе генератор).
+        :return: self.
+        """
+        for value in values:
+            self.add(value)
+        return self
+
+    def _normalize(self):
+        """
+        Сокращение накопленных сумм на НОД.
+        """
+        divisor = math.gcd(self._re, self._im, self._den)
+        if divisor > 1:
+            self._re //= divisor
+            self._im //= divisor
+            self._den //= divisor
+        divisor = math.gcd(self._square, self._square_den)
+        if divisor > 1:
+            self._square //= divisor
+            self._square_den //= divisor
+        self._pending = 0
+
+    def merge(self, other):
+        """
+        Объединение с другим агрегатором (на месте).
+
+        :param other: Объект StreamStats с теми же границами гистограммы.
+        :return: self.
+        :raises TypeError: Если other не является StreamStats.
+        :raises ValueError: Если границы гистограмм различаются.
+        """
+        if not isinstance(other, StreamStats):
+            raise TypeError("Объединять можно только объекты StreamStats.")
+        if self.edges != other.edges:
+            raise ValueError("Границы гистограмм должны совпадать.")
+        self.count += other.count
+        self._re, _ = _accumulate(self._re, self._den, other._re, other._den)
+        self._im, self._den = _accumulate(self._im, self._den, other._im, other._den)
+        self._square, self._square_den = _accumulate(
+            self._square, self._square_den, other._square, other._square_den)
+        self._complex = self._complex or other._complex
+        if other._min is not None and (self._min is None or other._min < self._min):
+            self._min = other._min
+        if other._max is not None and (self._max is None or other._max > self._max):
+            self._max = other._max
+        if self._bins is not None:
+            self._bins = [a + b for a, b in zip(self._bins, other._bins)]
+        self._normalize()
+        return self
+
+    def _check_count(self, minimum=1):
+        """
+        :raises ValueError: Если значений меньше minimum.
+        """
+        if self.count < minimum:
+            raise ValueError("Недостаточно значений для вычисления статистики.")
+
+    def total(self):
+        """
+        Точная сумма всех значений.
+
+        :return: Fraction или Complex (если добавлялись комплексные значения).
+        """
+        real = Fraction(self._re, self._den)
+        if self._complex:
+            return Complex(real, Fraction(self._im, self._den))
+        return real
+
+    def mean(self):
+        """
+        Точное среднее значение.
+
+        :return: Fraction или Complex.
+        :raises ValueError: Если значений нет.
+        """
+        self._check_count()
+        real = Fraction(self._re, self._den * self.count)
+        if self._complex:
+            return Complex(real, Fraction(self._im, self._den * self.count))
+        return real
+
+    def variance(self, ddof=0):
+        """
+        Точная дисперсия; для комплексных значений — среднее |z - mean|².
+
+        :param ddof: Поправка на число степеней свободы (1 — выборочная дисперсия).
+        :return: Fraction.
+        :raises ValueError: Если значений не больше ddof.
+        """
+        self._check_count(ddof + 1)
+        n = self.count
+        # Σ|z - mean|² = Σ|z|² - |Σz|² / n
+        den_square = self._den * self._den
+        numerator = n * self._square * den_square - (self._re ** 2 + self._im ** 2) * self._square_den
+        return Fraction(numerator, self._square_den * den_square * n * (n - ddof))
+
+    def _check_real(self):
+        """
+        :raises TypeError: Если добавлялись комплексные значения.
+        """
+        if self._complex:
+            raise TypeError("Статистика определена только для действительных значений.")
+
+    def minimum(self):
+        """
+        Наименьшее из добавленных значений.
+
+        :return: Fraction.
+        :raises TypeError: Если добавлялись комплексные значения.
+        :raises ValueError: Если значений нет.
+        """
+        self._check_real()
+        self._check_count()
+        return _copy(self._min)
+
+    def maximum(self):
+        """
+        Наибольшее из добавленных значений.
+
+        :return: Fraction.
+        :raises TypeError: Если добавлялись комплексные значения.
+        :raises ValueError: Если значений нет.
+        """
+        self._check_real()
+        self._check_count()
+        return _copy(self._max)
+
+    def histogram(self):
+        """
+        Количество значений в интервалах гистограммы.
+
+        Первый элемент — значения меньше первой границы, последний — не
+        меньше последней; элемент i — значения из [edges[i - 1], edges[i]).
+
+        :return: Список целых чисел длины len(edges) + 1.
+        :raises ValueError: Если границы гистограммы не заданы.
+        """
+        if self._bins is None:
+            raise ValueError("Границы гистограммы не заданы.")
+        return list(self._bins)
+
+    def __repr__(self):
+        return f"{type(self).__name__}(count={self.count})"
@@ -0,0 +1,71 @@
+import unittest
+from fraction_class import Fraction
+from complex import Complex
+from accumulator import FractionAccumulator, ComplexAccumulator
+
+
+class TestAccumulator(unittest.TestCase):
+    def test_fraction_accumulator(self):
+        # Скалярное произведение через совмещённое умножение-сложение
+        a = [Fraction(k, k + 1) for k in range(1, 100)]
+        b = [Fraction(1, k) for k in range(1, 100)]
+        acc = FractionAccumulator()
+        for x, y in zip(a, b):
+            acc.add_product(x, y)
+        expected = Fraction(0)
+        for x, y in zip(a, b):
+            expected = expected + x * y
+        self.assertEqual(acc.value(), expected)
+
+        # Операторы на месте возвращают тот же объект
+        acc = FractionAccumulator(Fraction(1, 2))
+        same = acc
+        acc += Fraction(1, 3)
+        acc -= 0.25
+        acc *= 6
+        self.assertIs(acc, same)
+        self.assertEqual(acc.value(), Fraction(7, 2))
+
+        # Перекрёстное произведение и вычитание произведения
+        acc = FractionAccumulator().add_cross(Fraction(1, 2), 3, Fraction(1, 3), Fraction(1, 4))
+        self.assertEqual(acc.value(), Fraction(17, 12))
+        self.assertEqual(acc.sub_product(Fraction(17, 6), Fraction(1, 2)).value(), Fraction(0))
+
+    def test_complex_accumulator(self):
+        # Совмещённое умножение-сложение над Complex
+        values = [Complex(Fraction(1, k), Fraction(k, 3)) for k in range(1, 30)]
+        acc = ComplexAccumulator()
+        expected = Complex(0)
+        for z in values:
+            acc.add_product(z, z.conjugate())
+            expected = expected + z * z.conjugate()
+        self.assertEqual(acc.value(), expected)
+
+        # Умножение на месте
+        acc = ComplexAccumulator(Complex(1, 1))
+        for _ in range(8):
+            acc *= Complex(1, 1)
+        self.assertEqual(acc.value(), Complex(1, 1) ** 9)
+
+        # Перекрёстное произведение: a * b - c * d
+        a, b, c, d = Complex(1, 2), Complex(Fraction(1, 2), 1), Complex(0, 1), Complex(3, Fraction(1, 5))
+        acc = ComplexAccumulator(Fraction(1, 7)).add_cross(a, b, c, d)
+        self.assertEqual(acc.value(), Complex(Fraction(1, 7)) + a * b - c * d)
+
+        # Сложение и вычитание накопителей
+        acc += ComplexAccumulator(Complex(1, -1))
+        acc -= Complex(1, -1)
+        self.assertEqual(acc.value(), Complex(Fraction(1, 7)) + a * b - c * d)
+
+    def test_complex_in_place_does_not_alias(self):
+        # Операции на месте не изменяют общие объекты Fraction
+        part = Fraction(1, 2)
+        z = Complex(part, part)
+        z += Complex(1, 1)
+        z *= Complex(0, 1)
+        self.assertEqual(part, Fraction(1, 2))
+        self.assertEqual(z, Complex(Fraction(-3, 2), Fraction(3, 2)))
+
+
+if __name__ == "__main__":
+    unittest.main()
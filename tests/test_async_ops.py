@@ -0,0 +1,96 @@
+import unittest
+import asyncio
+import operator
+from concurrent.futures import ThreadPoolExecutor
+from fraction_class import Fraction
+from complex import Complex
+from async_ops import apow, asum, amap
+
+
+class TestAsyncOps(unittest.TestCase):
+    def test_apow(self):
+        # Возведение в степень порциями
+        result = asyncio.run(apow(Complex(1, 1), 10, chunk_size=1))
+        self.assertEqual(result, Complex(0, 32))
+
+        # Отрицательная степень
+        result = asyncio.run(apow(Complex(1, 1), -1))
+        self.assertEqual(result, Complex(Fraction(1, 2), Fraction(-1, 2)))
+
+        # Дробь и вычисление в пуле потоков
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            result = asyncio.run(apow(Fraction(2, 3), 5, executor=executor))
+        self.assertEqual(result, Fraction(32, 243))
+
+        # Проверка исключения при нецелой степени
+        with self.assertRaises(TypeError):
+            asyncio.run(apow(Complex(1, 1), 1.5))
+
+    def test_asum(self):
+        # Сумма порциями
+        values = [Fraction(1, n) for n in range(1, 11)]
+        expected = Fraction(7381, 2520)
+        self.assertEqual(asyncio.run(asum(values, chunk_size=3)), expected)
+
+        # Исходные значения не изменяются
+        self.assertEqual(values[0], Fraction(1))
+
+        # Сумма в пуле потоков и сумма комплексных чисел
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            self.assertEqual(asyncio.run(asum(values, chunk_size=4, executor=executor)), expected)
+        self.assertEqual(asyncio.run(asum([Complex(1, 2), Complex(3, -1)])), Complex(4, 1))
+
+        # Пустая последовательность
+        self.assertEqual(asyncio.run(asum([])), Fraction(0))
+
+    def test_amap(self):
+        # Поэлементное произведение
+        a = [Fraction(1, 2), Fraction(2, 3), Fraction(3, 4)]
+        b = [2, 3, 4]
+        result = asyncio.run(amap(operator.mul, a, b, chunk_size=2))
+        self.assertEqual(result, [Fraction(1), Fraction(2), Fraction(3)])
+
+    def test_yields_to_event_loop(self):
+        # Другие задачи выполняются во время длительного вычисления:
+        # счётчик тиков проверяется сразу после вычисления, до ожидания задачи
+        async def ticks_during(computation):
+            ticks = []
+            done = False
+
+            async def ticker():
+                while not done:
+                    ticks.append(len(ticks))
+                    await asyncio.sleep(0)
+
+            task = asyncio.create_task(ticker())
+            await computation
+            seen = len(ticks)
+            done = True
+            await task
+            return seen
+
+        values = [Fraction(1, n) for n in range(1, 50)]
+        self.assertGreaterEqual(asyncio.run(ticks_during(asum(values, chunk_size=5))), 5)
+        # Показатель меньше 2^64: уступки происходят внутри бинарного возведения
+        self.assertGreaterEqual(asyncio.run(ticks_during(apow(Complex(Fraction(3, 7), 1), 1000))), 10)
+
+    def test_asum_mixed_types(self):
+        # Целые и вещественные значения вместе с дробями и комплексными числами
+        self.assertEqual(asyncio.run(asum([1, Fraction(1, 2)])), Fraction(3, 2))
+        self.assertEqual(asyncio.run(asum([0.5, 2, Complex(0, 1)])), Complex(Fraction(5, 2), 1))
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            result = asyncio.run(asum([1, 2, Complex(0, 1)], chunk_size=2, executor=executor))
+        self.assertEqual(result, Complex(3, 1))
+
+        # Комплексное значение перед действительными и целое начальное значение
+        self.assertEqual(asyncio.run(asum([Complex(1, 2), 3])), Complex(4, 2))
+        self.assertEqual(asyncio.run(asum([Complex(1, 1), Fraction(1, 2), 0.25])), Complex(Fraction(7, 4), 1))
+        self.assertEqual(asyncio.run(asum([Fraction(1, 2)], start=1)), Fraction(3, 2))
+        self.assertEqual(asyncio.run(asum([], start=2)), Fraction(2))
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            result = asyncio.run(asum([Complex(0, 1), 1, 2], start=1, chunk_size=1, executor=executor))
+        self.assertEqual(result, Complex(4, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr
+from fraction_class import Fraction
+from complex import Complex
+from batch_eval import evaluate, format_value, evaluate_lines, main
+
+
+class TestBatchEval(unittest.TestCase):
+    def test_evaluate(self):
+        # Десятичные литералы переводятся в дроби точно
+        self.assertEqual(evaluate("0.1 + 0.2"), Fraction(3, 10))
+        self.assertEqual(evaluate("1/3 - 2 ** -2"), Fraction(1, 12))
+        self.assertEqual(evaluate("(8/27) ** (2/3)"), Fraction(4, 9))
+
+        # Комплексные литералы с суффиксом i и мнимая единица
+        self.assertEqual(evaluate("(2 + 3i) * (1 - i)"), Complex(5, 1))
+        self.assertEqual(evaluate("i ** 2"), Fraction(-1))
+        self.assertEqual(evaluate("0.5i / 2"), Complex(0, Fraction(1, 4)))
+
+        # Проверка исключений
+        with self.assertRaises(ValueError):
+            evaluate("__import__('os')")
+        with self.assertRaises(ValueError):
+            evaluate("1 +")
+        with self.assertRaises(ZeroDivisionError):
+            evaluate("1 / (2 - 2)")
+
+    def test_size_limits(self):
+        # Огромные литералы и степени отклоняются до вычисления
+        with self.assertRaises(ValueError):
+            evaluate("1e10000000 + 1")
+        with self.assertRaises(ValueError):
+            evaluate("2.5e-10000000i")
+        with self.assertRaises(ValueError):
+            evaluate("(9 ** 99999) ** 99999")
+        with self.assertRaises(ValueError):
+            evaluate("(2 + i) ** 10000000")
+
+        # Большие, но допустимые результаты вычисляются
+        self.assertEqual(evaluate("9 ** 99999"), Fraction(9 ** 99999))
+        self.assertEqual(evaluate("(1 + i) ** 1000"), Fraction(2 ** 500))
+
+    def test_format_value(self):
+        # Точный, десятичный и приближённый форматы
+        value = Complex(Fraction(1, 3), Fraction(-1, 8))
+        self.assertEqual(format_value(value), "1/3 - 1/8i")
+        self.assertEqual(format_value(value, "decimal", 3), "0.333 - 0.125i")
+        self.assertEqual(format_value(Fraction(1, 4), "float"), "0.25")
+        with self.assertRaises(ValueError):
+            format_value(value, "hex")
+
+    def test_evaluate_lines(self):
+        # Порядок строк сохраняется, пустые строки и ошибки не прерывают обработку
+        lines = ["1/2 + 1/3\n", "\n", "1/0\n"] * 5
+        expected = [("5/6", False), ("", False)]
+        for jobs in (1, 2):
+            results = list(evaluate_lines(lines, jobs=jobs, chunk_size=2))
+            self.assertEqual(len(results), 15)
+            self.assertEqual(results[:2], expected)
+            self.assertTrue(results[2][1])
+            self.assertEqual(results[-3:-1], expected)
+
+    def test_main(self):
+        # Вычисление файла с выводом в файл и сводкой в stderr
+        with tempfile.TemporaryDirectory() as directory:
+            source = os.path.join(directory, "input.txt")
+            target = os.path.join(directory, "output.txt")
+            with open(source, "w", encoding="utf-8") as file:
+                file.write("1/3\n2 ** 10\n")
+            stderr = io.StringIO()
+            with redirect_stderr(stderr):
+                code = main([source, "-o", target, "--format", "decimal", "--digits", "2", "--stats"])
+            self.assertEqual(code, 0)
+            with open(target, encoding="utf-8") as file:
+                self.assertEqual(file.read(), "0.33\n1024.00\n")
+            self.assertIn("lines: 2", stderr.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -127,6 +127,39 @@ class TestComplex(unittest.TestCase):
         c = Complex(3, 4)
         self.assertEqual(abs(c), 5)
 
+        # Кэш сбрасывается при изменении числа
+        c.real = 0
+        self.assertEqual(abs(c), 4)
+        c *= Complex(0, 1)
+        self.assertEqual(c.arg(), math.pi)
+
+    def test_norm(self):
+        # Точный квадрат модуля
+        c = Complex(Fraction(1, 2), Fraction(1, 3))
+        self.assertEqual(c.norm(), Fraction(13, 36))
+        self.assertEqual(Complex(Fraction(1, 2), Fraction(1, 2)).norm(), Fraction(1, 2))
+
+        # Возвращается независимая копия кэшированного значения
+        norm = c.norm()
+        norm += 1
+        self.assertEqual(c.norm(), Fraction(13, 36))
+
+        # Изменение части на месте сбрасывает кэш
+        part = c.real
+        part += 1
+        c.real = part
+        self.assertEqual(c.norm(), Fraction(85, 36))
+
+    def test_compare_abs(self):
+        # Точное сравнение модулей без извлечения корня
+        self.assertEqual(Complex(3, 4).compare_abs(Complex(0, 5)), 0)
+        self.assertEqual(Complex(3, 4).compare_abs(Complex(Fraction(5 * 10 ** 20 + 1, 10 ** 20))), -1)
+        self.assertEqual(Complex(1, 1).compare_abs(1), 1)
+        values = [Complex(2, 2), Complex(0, 1), Complex(Fraction(-3, 2))]
+        self.assertEqual(sorted(values, key=Complex.norm), [values[1], values[2], values[0]])
+        with self.assertRaises(TypeError):
+            Complex(1).compare_abs("1")
+
     def test_power(self):
         # Тест 1: Возведение в положительную степень
         c1 = Complex(2, 3)
@@ -151,6 +184,15 @@ class TestComplex(unittest.TestCase):
         with self.assertRaises(TypeError):
             c4 ** 1.5  # Нецелая степень должна вызывать TypeError
 
+    def test_large_power(self):
+        # Большие степени вычисляются бинарным возведением
+        self.assertEqual(Complex(1, 1) ** 1000, Complex(2 ** 500))
+        self.assertEqual(Complex(0, 1) ** (10 ** 6 + 3), Complex(0, -1))
+        self.assertEqual(Complex(1, -1) ** -4, Complex(Fraction(-1, 4)))
+        result = Complex(2, 1) ** 300000
+        self.assertEqual(result.norm(), 5 ** 300000)
+        self.assertEqual(result * Complex(2, 1), Complex(2, 1) ** 300001)
+
     def test_conjugate(self):
         # Сопряженное комплексное число
         c = Complex(1, 2)
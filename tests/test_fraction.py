@@ -1,4 +1,5 @@
 import unittest
+from decimal import ROUND_FLOOR, ROUND_HALF_UP
 from fraction_class import Fraction
 
 
@@ -29,6 +30,10 @@ class TestFraction(unittest.TestCase):
         self.assertEqual(f.numerator, 3)
         self.assertEqual(f.denominator, 4)
 
+        # Значения, не представимые точно, и экспоненциальная запись
+        self.assertEqual(Fraction.from_float(0.29), Fraction(29, 100))
+        self.assertEqual(Fraction.from_float(1e-17), Fraction(1, 10 ** 17))
+
         # Проверка исключения при неверном типе
         with self.assertRaises(TypeError):
             Fraction.from_float("0.75")
@@ -127,6 +132,94 @@ class TestFraction(unittest.TestCase):
         self.assertEqual(Fraction(1, 2), 0.5)
         self.assertNotEqual(Fraction(1, 2), 0.75)
 
+    def test_ordering(self):
+        # Проверка операторов порядка
+        self.assertTrue(Fraction(1, 3) < Fraction(1, 2))
+        self.assertTrue(Fraction(1, 2) <= Fraction(2, 4))
+        self.assertTrue(Fraction(-1, 2) > -1)
+        self.assertTrue(Fraction(3, 4) >= 0.75)
+        self.assertFalse(Fraction(1, 2) > 0.5)
+
+        # Почти равные большие дроби различаются точной проверкой
+        big = 10 ** 60
+        self.assertTrue(Fraction(big, big + 1) < Fraction(big + 1, big + 2))
+
+        # Результат не зависит от режима фильтрации
+        Fraction.filtered = False
+        try:
+            self.assertTrue(Fraction(big, big + 1) < Fraction(big + 1, big + 2))
+        finally:
+            Fraction.filtered = True
+
+    def test_interval(self):
+        # Сравнения и знак остаются верными после изменения дроби на месте
+        f = Fraction(1, 3)
+        self.assertTrue(f < Fraction(1, 2))
+        self.assertEqual(f.sign(), 1)
+        f += 1
+        self.assertTrue(f > Fraction(1, 2))
+        self.assertTrue(f < Fraction(4 * 10 ** 30 + 1, 3 * 10 ** 30))
+        self.assertTrue(f > Fraction(4 * 10 ** 30 - 1, 3 * 10 ** 30))
+        f -= 2
+        self.assertTrue(f < 0)
+        self.assertEqual(f.sign(), -1)
+        f *= 0
+        self.assertEqual(f.sign(), 0)
+        self.assertTrue(f <= 0 <= f)
+
+    def test_sign(self):
+        # Проверка знака
+        self.assertEqual(Fraction(-3, 4).sign(), -1)
+        self.assertEqual(Fraction(0).sign(), 0)
+        self.assertEqual(Fraction(5, 2).sign(), 1)
+
+    def test_continued_fraction(self):
+        # Разложение в цепную дробь
+        self.assertEqual(list(Fraction(415, 93).continued_fraction()), [4, 2, 6, 7])
+        self.assertEqual(list(Fraction(-7, 3).continued_fraction()), [-3, 1, 2])
+
+        # Ленивое получение первых членов для огромной дроби
+        f = Fraction(3 ** 20000, 2 ** 31000 + 1)
+        terms = f.continued_fraction()
+        self.assertEqual(next(terms), 3 ** 20000 // (2 ** 31000 + 1))
+
+    def test_convergents(self):
+        # Подходящие дроби числа 355/113
+        convergents = list(Fraction(355, 113).convergents())
+        self.assertEqual(convergents, [Fraction(3), Fraction(22, 7), Fraction(355, 113)])
+
+    def test_limit_denominator(self):
+        # Наилучшее приближение с ограниченным знаменателем
+        pi = Fraction(314159265358979, 100000000000000)
+        self.assertEqual(pi.limit_denominator(10), Fraction(22, 7))
+        self.assertEqual(pi.limit_denominator(1000), Fraction(355, 113))
+        self.assertEqual(Fraction(3, 4).limit_denominator(10), Fraction(3, 4))
+
+        # Проверка исключения при неверном знаменателе
+        with self.assertRaises(ValueError):
+            pi.limit_denominator(0)
+
+    def test_dyadic(self):
+        # Определение двоично-рациональных дробей
+        self.assertTrue(Fraction(3, 8).is_dyadic())
+        self.assertTrue(Fraction(5).is_dyadic())
+        self.assertFalse(Fraction(1, 3).is_dyadic())
+
+        # Сокращение сдвигом, в том числе при отрицательном знаменателе
+        self.assertEqual(repr(Fraction(12, -16)), "Fraction(-3, 4)")
+        self.assertEqual(repr(Fraction(0, 8)), "Fraction(0)")
+
+        # Арифметика остаётся двоично-рациональной
+        self.assertEqual(Fraction(3, 8) + Fraction(5, 8), Fraction(1))
+        self.assertEqual(Fraction(3, 8) - Fraction(1, 2), Fraction(-1, 8))
+        self.assertEqual(Fraction(3, 4) * Fraction(2, 3), Fraction(1, 2))
+        self.assertEqual(Fraction(3, 8) / Fraction(-1, 4), Fraction(-3, 2))
+
+        # Деление, выводящее из множества, идёт общим путём
+        result = Fraction(1, 2) / 3
+        self.assertEqual(result, Fraction(1, 6))
+        self.assertFalse(result.is_dyadic())
+
     def test_negation(self):
         # Проверка унарного минуса
         f = Fraction(1, 2)
@@ -148,10 +241,49 @@ class TestFraction(unittest.TestCase):
         self.assertEqual(result.numerator, 4)
         self.assertEqual(result.denominator, 9)
 
+        # Отрицательные степени меняют местами числитель и знаменатель
+        self.assertEqual(f ** -3, Fraction(27, 8))
+        result = Fraction(-2, 3) ** -3
+        self.assertEqual((result.numerator, result.denominator), (-27, 8))
+        self.assertEqual(Fraction(0) ** 0, Fraction(1))
+        with self.assertRaises(ZeroDivisionError):
+            Fraction(0) ** -1
+
         # Проверка исключения при неверной степени
         with self.assertRaises(TypeError):
             f ** 1.5
 
+    def test_rational_power(self):
+        # Дробные степени с рациональным результатом
+        self.assertEqual(Fraction(4, 9) ** Fraction(1, 2), Fraction(2, 3))
+        self.assertEqual(Fraction(8, 27) ** Fraction(-2, 3), Fraction(9, 4))
+        self.assertEqual(Fraction(-8, 125) ** Fraction(1, 3), Fraction(-2, 5))
+        self.assertEqual(Fraction(3, 7) ** Fraction(4, 2), Fraction(9, 49))
+        big = Fraction(3 ** 300, 7 ** 150)
+        self.assertEqual(big ** Fraction(1, 150), Fraction(9, 7))
+
+        # Иррациональный и недействительный результаты
+        with self.assertRaises(ValueError):
+            Fraction(2) ** Fraction(1, 2)
+        with self.assertRaises(ValueError):
+            Fraction(4, 3 ** 6 + 1) ** Fraction(1, 2)
+        with self.assertRaises(ValueError):
+            Fraction(-4) ** Fraction(1, 2)
+
+        # Корень огромной степени из малого числа отсекается сразу
+        with self.assertRaises(ValueError):
+            Fraction(3) ** Fraction(1, 10 ** 10)
+        self.assertEqual(Fraction(1, 2 ** 64) ** Fraction(1, 64), Fraction(1, 2))
+
+    def test_modular_power(self):
+        # Трёхаргументный pow для целых дробей
+        self.assertEqual(pow(Fraction(3), 200, 1000007), Fraction(pow(3, 200, 1000007)))
+        self.assertEqual(pow(Fraction(3), -1, 7), Fraction(5))
+
+        # Проверка исключения для нецелой дроби
+        with self.assertRaises(TypeError):
+            pow(Fraction(1, 2), 2, 7)
+
     def test_conversion(self):
         # Проверка преобразования в float
         f = Fraction(1, 2)
@@ -165,6 +297,56 @@ class TestFraction(unittest.TestCase):
         f = Fraction(3, 4)
         self.assertEqual(round(f), 1)
 
+    def test_to_decimal(self):
+        # Точная десятичная запись с заданным числом знаков
+        self.assertEqual(Fraction(355, 113).to_decimal(10), "3.1415929204")
+        self.assertEqual(Fraction(1, 8).to_decimal(2), "0.12")
+        self.assertEqual(Fraction(1, 8).to_decimal(2, rounding=ROUND_HALF_UP), "0.13")
+        self.assertEqual(Fraction(-1, 8).to_decimal(2, rounding=ROUND_FLOOR), "-0.13")
+        self.assertEqual(Fraction(7, 2).to_decimal(0), "4")
+
+        # Тысячи знаков без потери точности
+        digits = Fraction(1, 7).to_decimal(5004)
+        self.assertEqual(len(digits), 5006)
+        self.assertEqual(digits[-12:], "142857142857")
+
+        # Полная запись с периодом
+        self.assertEqual(Fraction(1, 6).to_decimal(), "0.1(6)")
+        self.assertEqual(Fraction(-22, 7).to_decimal(), "-3.(142857)")
+        self.assertEqual(Fraction(3, 8).to_decimal(), "0.375")
+        self.assertEqual(Fraction(1, 6).decimal_period(), (1, 1))
+        # Слишком длинный период: ошибка вместо перебора до знаменателя
+        with self.assertRaises(ValueError):
+            Fraction(1, 10 ** 20 + 39).to_decimal()
+        with self.assertRaises(ValueError):
+            Fraction(1, 7).decimal_period(max_period=5)
+        self.assertEqual(Fraction(1, 7).to_decimal(max_period=6), "0.(142857)")
+        self.assertEqual(Fraction(1, 10 ** 20 + 39).to_decimal(3), "0.000")
+
+        # Проверка исключения при отрицательном числе знаков
+        with self.assertRaises(ValueError):
+            Fraction(1, 3).to_decimal(-1)
+
+    def test_format(self):
+        # Фиксированная и экспоненциальная запись
+        f = Fraction(355, 113)
+        self.assertEqual(format(f, ".5f"), "3.14159")
+        self.assertEqual(format(f, "+10.2f"), "     +3.14")
+        self.assertEqual(format(f, "<8.1f"), "3.1     ")
+        self.assertEqual(format(f, ".3e"), "3.142e+00")
+        self.assertEqual(format(Fraction(-1, 80000), ".2E"), "-1.25E-05")
+        self.assertEqual(format(Fraction(1, 4), ".1%"), "25.0%")
+        self.assertEqual(format(Fraction(1234567, 2), ",.1f"), "617,283.5")
+        self.assertEqual(format(Fraction(-1, 3), "08.3f"), "-000.333")
+
+        # Без типа выводится строковое представление
+        self.assertEqual(format(Fraction(1, 3), ">5"), "  1/3")
+        self.assertEqual(f"{Fraction(2, 3):.2f}", "0.67")
+
+        # Проверка исключения при неподдерживаемом типе
+        with self.assertRaises(ValueError):
+            format(f, ".2g")
+
     def test_string_representation(self):
         # Проверка строкового представления
         f = Fraction(3, 4)
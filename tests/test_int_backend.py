@@ -0,0 +1,61 @@
+import unittest
+import int_backend
+from fraction_class import Fraction
+from complex import Complex
+from accumulator import FractionAccumulator, ComplexAccumulator
+
+
+class TestIntBackend(unittest.TestCase):
+    def tearDown(self):
+        int_backend.set_backend("gmpy2" if int_backend.gmpy2 is not None else "int")
+
+    def test_default_backend(self):
+        # По умолчанию выбирается gmpy2, если он установлен
+        expected = "gmpy2" if int_backend.gmpy2 is not None else "int"
+        self.assertEqual(int_backend.get_backend(), expected)
+        self.assertIn("int", int_backend.available_backends())
+
+    def test_int_backend(self):
+        # Работа на встроенном int
+        int_backend.set_backend("int")
+        f = Fraction(6, 8) + Fraction(1, 4)
+        self.assertEqual(f, Fraction(1))
+        self.assertEqual(float(Fraction(1, 4)), 0.25)
+
+    def test_unknown_backend(self):
+        # Проверка исключения для неизвестного бэкенда
+        with self.assertRaises(ValueError):
+            int_backend.set_backend("unknown")
+
+    @unittest.skipUnless(int_backend.gmpy2 is not None, "gmpy2 не установлен")
+    def test_gmpy2_backend(self):
+        # Дроби и комплексные числа принимают mpz и работают на gmpy2
+        int_backend.set_backend("gmpy2")
+        mpz = int_backend.gmpy2.mpz
+        f = Fraction(mpz(6), mpz(8))
+        self.assertEqual(f, Fraction(3, 4))
+        self.assertEqual(f + mpz(1), Fraction(7, 4))
+        self.assertIsInstance(float(f), float)
+        self.assertIsInstance(int(f), int)
+        self.assertEqual(Complex(1, 2) * mpz(2), Complex(2, 4))
+
+    @unittest.skipUnless(int_backend.gmpy2 is not None, "gmpy2 не установлен")
+    def test_gmpy2_accumulators(self):
+        # Аккумуляторы сокращают mpz через НОД бэкенда
+        int_backend.set_backend("gmpy2")
+        mpz = int_backend.gmpy2.mpz
+        self.assertEqual(int_backend.true_divide(mpz(1) << 2000, mpz(3) << 1998), 4 / 3)
+        total = FractionAccumulator()
+        product = ComplexAccumulator()
+        for k in range(1, 200):
+            total += Fraction(mpz(1), mpz(k * (k + 1)))
+            product.add_product(Complex(Fraction(mpz(1), mpz(k))), Complex(0, Fraction(mpz(k), mpz(3))))
+        self.assertEqual(total.value(), Fraction(199, 200))
+        self.assertEqual(product.value(), Complex(0, Fraction(199, 3)))
+        product.normalize()
+        self.assertEqual(product.denominator, 3)
+        self.assertIsInstance(product.denominator, type(mpz(0)))
+
+
+if __name__ == "__main__":
+    unittest.main()
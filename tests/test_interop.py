@@ -0,0 +1,90 @@
+import unittest
+import ctypes
+from array import array
+from fraction_class import Fraction
+from complex import Complex
+import interop
+from interop import from_buffer, to_float64, to_complex128, to_int64_pairs, FractionArray, ComplexArray
+
+
+class TestInterop(unittest.TestCase):
+    def test_from_integer_buffer(self):
+        # Целые числители и знаменатели из буферов
+        result = from_buffer(array("q", [1, 6, -3]), array("q", [2, 8, 9]))
+        self.assertEqual(result, [Fraction(1, 2), Fraction(3, 4), Fraction(-1, 3)])
+
+        # Только числители
+        self.assertEqual(from_buffer(array("i", [4, 5])), [Fraction(4), Fraction(5)])
+
+        # Проверка исключения при разной длине
+        with self.assertRaises(ValueError):
+            from_buffer(array("q", [1, 2]), array("q", [1]))
+
+    def test_from_float_buffer(self):
+        # Точное двоичное разложение float
+        result = from_buffer(array("d", [0.5, -0.75, 0.1]))
+        self.assertEqual(result[:2], [Fraction(1, 2), Fraction(-3, 4)])
+        self.assertEqual(result[2], Fraction(3602879701896397, 36028797018963968))
+
+        # Проверка исключения при неподдерживаемом формате
+        with self.assertRaises(TypeError):
+            from_buffer(array("u", "ab"))
+
+    def test_byte_order(self):
+        # Буферы с порядком байтов big-endian, в том числе многомерные
+        big_int64 = ctypes.c_int64.__ctype_be__
+        matrix = (big_int64 * 2 * 2)()
+        matrix[0][0], matrix[0][1], matrix[1][0], matrix[1][1] = 1, 2, 3, -4
+        self.assertEqual(from_buffer(matrix), [Fraction(1), Fraction(2), Fraction(3), Fraction(-4)])
+        self.assertEqual(from_buffer((big_int64 * 2)(3, 5), (big_int64 * 2)(4, 10)), [Fraction(3, 4), Fraction(1, 2)])
+        doubles = (ctypes.c_double.__ctype_be__ * 2)(0.5, -1.25)
+        self.assertEqual(from_buffer(doubles), [Fraction(1, 2), Fraction(-5, 4)])
+
+        # Явный little-endian формат ctypes
+        self.assertEqual(from_buffer((ctypes.c_int32 * 2)(7, -1)), [Fraction(7), Fraction(-1)])
+
+    def test_exporters(self):
+        # Экспорт в буферы
+        values = [Fraction(1, 2), Fraction(-1, 4)]
+        self.assertEqual(list(to_float64(values)), [0.5, -0.25])
+        self.assertEqual(to_int64_pairs(values).tolist(), [[1, 2], [-1, 4]] if interop.numpy is not None else [1, 2, -1, 4])
+        exported = to_complex128([Complex(1, Fraction(1, 2))])
+        if interop.numpy is None:
+            self.assertEqual(list(exported), [1.0, 0.5])
+        else:
+            self.assertEqual(exported.tolist(), [1 + 0.5j])
+
+    def test_arrays(self):
+        # Массивы-обёртки
+        fractions = FractionArray.from_buffer(array("q", [1, 2]), array("q", [3, 4]))
+        self.assertEqual(len(fractions), 2)
+        self.assertEqual(fractions[1], Fraction(1, 2))
+        self.assertEqual(list(fractions), [Fraction(1, 3), Fraction(1, 2)])
+        self.assertEqual(ComplexArray([Complex(1, 2)])[0], Complex(1, 2))
+
+    @unittest.skipUnless(interop.numpy is not None, "numpy не установлен")
+    def test_numpy(self):
+        # Обмен данными с numpy
+        np = interop.numpy
+        result = interop.from_numpy(np.array([[1, 2], [3, 4]], dtype=np.int64))
+        self.assertEqual(result, [Fraction(1), Fraction(2), Fraction(3), Fraction(4)])
+        result = interop.from_numpy(np.array([0.5 + 0.25j], dtype=np.complex128))
+        self.assertEqual(result, [Complex(Fraction(1, 2), Fraction(1, 4))])
+        result = interop.from_numpy(np.arange(6, dtype=np.int64)[::2])
+        self.assertEqual(result, [Fraction(0), Fraction(2), Fraction(4)])
+        result = interop.from_numpy(np.array([[1.5], [-0.099975586]], dtype=np.float16))
+        self.assertEqual(result, [Fraction(3, 2), Fraction(-819, 8192)])
+        result = interop.from_numpy(np.array([2.5], dtype=">f2"))
+        self.assertEqual(result, [Fraction(5, 2)])
+        result = interop.from_numpy(np.array([[1, 2], [3, 4]], dtype=">i8"))
+        self.assertEqual(result, [Fraction(1), Fraction(2), Fraction(3), Fraction(4)])
+        result = interop.from_numpy(np.array([0.5 - 2j], dtype=">c16"))
+        self.assertEqual(result, [Complex(Fraction(1, 2), -2)])
+        result = interop.from_numpy(np.array([[0.25], [-8.0]], dtype=">f8"))
+        self.assertEqual(result, [Fraction(1, 4), Fraction(-8)])
+        self.assertEqual(np.asarray(FractionArray([Fraction(1, 4)])).tolist(), [0.25])
+        self.assertEqual(np.asarray(ComplexArray([Complex(1, -1)])).tolist(), [1 - 1j])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+from fraction_class import Fraction
+from complex import Complex
+from iteration import iterate_map, escape_times, complex_grid
+
+
+def _reference_escape(point, max_iter):
+    c = complex(float(point.real), float(point.imag))
+    z = 0
+    for k in range(max_iter):
+        if abs(z) > 2:
+            return k
+        z = z * z + c
+    return max_iter
+
+
+class TestIteration(unittest.TestCase):
+    def test_complex_grid(self):
+        # Сетка с рациональным шагом
+        grid = complex_grid(-1, 1, 0, 1, 3, 2)
+        self.assertEqual(len(grid), 6)
+        self.assertEqual(grid[0], Complex(-1, 1))
+        self.assertEqual(grid[4], Complex(0, 0))
+
+    def test_mandelbrot(self):
+        # Точные значения для известных точек
+        points = [Complex(0), Complex(-1), Complex(1), Complex(0, 1), Complex(2, 2)]
+        self.assertEqual(escape_times(points, max_iter=20), [20, 20, 3, 20, 1])
+
+        # Совпадение с вычислением в float на сетке
+        grid = complex_grid(-2, Fraction(1, 2), -1, 1, 12, 6)
+        expected = [_reference_escape(p, 10) for p in grid]
+        self.assertEqual(escape_times(grid, max_iter=10), expected)
+
+    def test_bounded_precision(self):
+        # Ограничение знаменателей не меняет результат на грубой сетке
+        grid = complex_grid(-2, Fraction(1, 2), -1, 1, 12, 6)
+        expected = [_reference_escape(p, 25) for p in grid]
+        counts, values = iterate_map(grid, max_iter=25, precision_bits=80)
+        self.assertEqual(counts, expected)
+        self.assertTrue(all(v.real.denominator <= 2 ** 80 for v in values))
+
+    def test_julia_and_fixed_point(self):
+        # Режим множества Жюлиа с общей константой
+        self.assertEqual(escape_times([Complex(0), Complex(1, 1)], c=Complex(Fraction(-1, 2)), max_iter=12), [12, 1])
+
+        # Поиск неподвижной точки z -> z/2 + 1 с остановкой по сходимости
+        counts, values = iterate_map([0, 10], coefficients=(0, Fraction(1, 2)), c=1,
+                                     max_iter=100, bailout=100, tolerance=Fraction(1, 1000))
+        self.assertTrue(all(count < 100 for count in counts))
+        for value in values:
+            self.assertAlmostEqual(float(value.real), 2, places=2)
+
+        # Проверка исключения при пустом многочлене
+        with self.assertRaises(ValueError):
+            iterate_map([0], coefficients=())
+
+
+if __name__ == "__main__":
+    unittest.main()
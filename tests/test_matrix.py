@@ -0,0 +1,98 @@
+import unittest
+from fraction_class import Fraction
+from complex import Complex
+from matrix import RationalMatrix, ComplexMatrix
+from number_theory import word_primes
+
+
+class TestRationalMatrix(unittest.TestCase):
+    def test_determinant(self):
+        # Определитель целочисленной матрицы
+        m = RationalMatrix([[2, 1], [1, 3]])
+        self.assertEqual(m.determinant(), Fraction(5))
+
+        # Определитель с дробями и перестановкой строк
+        m = RationalMatrix([[0, Fraction(1, 2)], [Fraction(1, 3), 1]])
+        self.assertEqual(m.determinant(), Fraction(-1, 6))
+
+        # Вырожденная матрица
+        m = RationalMatrix([[1, 2], [2, 4]])
+        self.assertEqual(m.determinant(), Fraction(0))
+
+        # Проверка исключения для неквадратной матрицы
+        with self.assertRaises(ValueError):
+            RationalMatrix([[1, 2, 3], [4, 5, 6]]).determinant()
+
+    def test_solve(self):
+        # Решение системы с дробными коэффициентами
+        m = RationalMatrix([[Fraction(1, 2), 1], [1, Fraction(1, 3)]])
+        x = m.solve([1, 2])
+        self.assertEqual(x, [Fraction(2), Fraction(0)])
+
+        # Проверка подстановкой
+        m = RationalMatrix([[3, 2, -1], [2, -2, 4], [-1, Fraction(1, 2), -1]])
+        x = m.solve([1, -2, 0])
+        self.assertEqual(x, [Fraction(1), Fraction(-2), Fraction(-2)])
+
+        # Проверка исключения для вырожденной матрицы
+        with self.assertRaises(ValueError):
+            RationalMatrix([[1, 2], [2, 4]]).solve([1, 1])
+
+    def test_solve_lifting(self):
+        # Матрица Гильберта: большие знаменатели решения при малых элементах
+        n = 12
+        hilbert = [[Fraction(1, i + j + 1) for j in range(n)] for i in range(n)]
+        expected = [Fraction(k + 1, k + 2) for k in range(n)]
+        b = [sum((a * x for a, x in zip(row, expected)), Fraction(0)) for row in hilbert]
+        self.assertEqual(RationalMatrix(hilbert).solve(b), expected)
+
+        # Матрица, вырожденная по первому простому модулю, но не над рациональными числами
+        p = next(word_primes())
+        self.assertEqual(RationalMatrix([[p, 1], [0, 1]]).solve([3, 2]), [Fraction(1, p), Fraction(2)])
+
+    def test_inverse(self):
+        # Обратная матрица
+        m = RationalMatrix([[4, 7], [2, 6]])
+        inv = m.inverse()
+        self.assertEqual(inv, RationalMatrix([[Fraction(3, 5), Fraction(-7, 10)], [Fraction(-1, 5), Fraction(2, 5)]]))
+
+        # Проверка исключения для вырожденной матрицы
+        with self.assertRaises(ValueError):
+            RationalMatrix([[1, 2], [2, 4]]).inverse()
+
+    def test_rank(self):
+        # Ранг прямоугольных и вырожденных матриц
+        self.assertEqual(RationalMatrix([[1, 2, 3], [2, 4, 6]]).rank(), 1)
+        self.assertEqual(RationalMatrix([[0, 1, 2], [0, 0, 1], [0, 2, 5]]).rank(), 2)
+        self.assertEqual(RationalMatrix([[1, 0], [0, 1], [1, 1]]).rank(), 2)
+
+
+class TestComplexMatrix(unittest.TestCase):
+    def test_determinant(self):
+        # Определитель комплексной матрицы: (1+i)(1-i) - 2i * 1 = 2 - 2i
+        m = ComplexMatrix([[Complex(1, 1), Complex(0, 2)], [1, Complex(1, -1)]])
+        self.assertEqual(m.determinant(), Complex(2, -2))
+
+    def test_solve(self):
+        # Решение системы с рациональными комплексными коэффициентами
+        m = ComplexMatrix([[Complex(1, 1), 0], [0, Complex(0, Fraction(1, 2))]])
+        x = m.solve([Complex(2), Complex(1)])
+        self.assertEqual(x, [Complex(1, -1), Complex(0, -2)])
+
+    def test_inverse(self):
+        # Обратная матрица: произведение с исходной даёт единичную
+        m = ComplexMatrix([[Complex(1, 2), 3], [Complex(0, 1), Complex(Fraction(1, 2), 0)]])
+        inv = m.inverse()
+        for i in range(2):
+            for j in range(2):
+                value = m[i, 0] * inv[0, j] + m[i, 1] * inv[1, j]
+                self.assertEqual(value, Complex(1 if i == j else 0))
+
+    def test_rank(self):
+        # Ранг: вторая строка пропорциональна первой с множителем i
+        m = ComplexMatrix([[1, Complex(0, 1)], [Complex(0, 1), -1]])
+        self.assertEqual(m.rank(), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
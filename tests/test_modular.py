@@ -0,0 +1,91 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from fraction_class import Fraction
+from complex import Complex
+from matrix import RationalMatrix
+from number_theory import crt_combine, rational_reconstruction, word_primes
+from modular import (reduce_mod, gaussian_mul_mod, modular_evaluate, modular_product,
+                     modular_polyval, modular_determinant)
+
+
+def _complex_square(modulus, z):
+    # Квадрат гауссова числа по модулю
+    return gaussian_mul_mod(z, z, modulus)
+
+
+def _failing(modulus, value):
+    # Ошибка в вызывающем коде не должна приниматься за неудачный модуль
+    raise ValueError("ошибка вызывающего кода")
+
+
+class TestModular(unittest.TestCase):
+    def test_number_theory_helpers(self):
+        # Китайская теорема об остатках
+        self.assertEqual(crt_combine(2, 3, 3, 5), (8, 15))
+
+        # Рациональное восстановление дроби -3/7 по модулю 1000003
+        p = 1000003
+        residue = -3 * pow(7, -1, p) % p
+        self.assertEqual(rational_reconstruction(residue, p), (-3, 7))
+
+    def test_reduce_mod(self):
+        # Образ дроби и комплексного числа по модулю 11
+        self.assertEqual(reduce_mod(Fraction(1, 2), 11), 6)
+        self.assertEqual(reduce_mod(Complex(Fraction(1, 2), 3), 11), (6, 3))
+
+        # Знаменатель, кратный модулю, — «неудачный» модуль
+        with self.assertRaises(ZeroDivisionError):
+            reduce_mod(Fraction(1, 22), 11)
+
+    def test_product_and_polyval(self):
+        # Произведение большого числа дробей
+        values = [Fraction(k, k + 1) for k in range(1, 60)]
+        self.assertEqual(modular_product(values), Fraction(1, 60))
+
+        # Значение многочлена в дробной точке
+        coefficients = [Fraction(1, 3), -2, Fraction(5, 7)]
+        x = Fraction(3, 4)
+        expected = coefficients[0] * x * x + x * coefficients[1] + coefficients[2]
+        self.assertEqual(modular_polyval(coefficients, x), expected)
+
+    def test_determinant(self):
+        # Совпадение с определителем, вычисленным методом Бареиса
+        rows = [[Fraction(i + 1, j + 2) + (i == j) for j in range(5)] for i in range(5)]
+        self.assertEqual(modular_determinant(rows), RationalMatrix(rows).determinant())
+
+        # Вырожденная матрица
+        self.assertEqual(modular_determinant([[1, 2], [2, 4]]), 0)
+
+        # Проверка исключения для неквадратной матрицы
+        with self.assertRaises(ValueError):
+            modular_determinant([[1, 2]])
+
+    def test_complex_and_executor(self):
+        # Комплексный результат с параллельным вычислением по модулям
+        z = Complex(Fraction(2, 3), Fraction(-1, 5))
+        with ThreadPoolExecutor(2) as executor:
+            result = modular_evaluate(_complex_square, z, executor=executor)
+        self.assertEqual(result, z * z)
+
+    def test_unlucky_primes(self):
+        # Знаменатель делится на первые простые модули, в том числе на проверочные
+        primes = word_primes()
+        denominator = 1
+        for _ in range(12):
+            denominator *= next(primes)
+        values = [Fraction(1, denominator), Fraction(3, 7)]
+        self.assertEqual(modular_product(values, batch_size=1), Fraction(3, 7 * denominator))
+
+        # Исключения функции не перехватываются
+        with self.assertRaises(ValueError):
+            modular_evaluate(_failing, Fraction(1, 2))
+
+    def test_prime_limit(self):
+        # Слишком малый предел количества модулей
+        huge = [Fraction(3 ** 400 + 1, 2 ** 300 + 1)]
+        with self.assertRaises(ValueError):
+            modular_product(huge, max_primes=4)
+
+
+if __name__ == "__main__":
+    unittest.main()
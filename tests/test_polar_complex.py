@@ -0,0 +1,89 @@
+import unittest
+import math
+from fraction_class import Fraction
+from complex import Complex
+from polar_complex import PolarComplex
+
+
+class TestPolarComplex(unittest.TestCase):
+    def test_initialization(self):
+        # Угол приводится к промежутку (-π, π]
+        p = PolarComplex(2, 3 * math.pi)
+        self.assertEqual(p.modulus, 2.0)
+        self.assertAlmostEqual(p.angle, math.pi)
+
+        # Проверка исключения при отрицательном модуле
+        with self.assertRaises(ValueError):
+            PolarComplex(-1, 0)
+
+    def test_from_complex(self):
+        # Ленивое преобразование из Complex
+        p = PolarComplex.from_complex(Complex(3, 4))
+        self.assertEqual(p.modulus, 5.0)
+        self.assertAlmostEqual(p.angle, math.atan2(4, 3))
+
+        # Обратное преобразование возвращает исходное число без потерь
+        self.assertEqual(p.to_complex(), Complex(3, 4))
+
+    def test_multiplication_and_division(self):
+        # Умножение и деление в полярной форме
+        p = PolarComplex(2, math.pi / 4)
+        q = PolarComplex(3, math.pi / 4)
+        self.assertEqual(p * q, PolarComplex(6, math.pi / 2))
+        self.assertEqual(p / q, PolarComplex(2 / 3, 0))
+
+        # Операции с Complex и вещественными числами
+        self.assertEqual(p * Complex(0, 1), PolarComplex(2, 3 * math.pi / 4))
+        self.assertEqual(2 * p, PolarComplex(4, math.pi / 4))
+        self.assertEqual(p * -1, PolarComplex(2, -3 * math.pi / 4))
+
+        # Проверка исключения при делении на ноль
+        with self.assertRaises(ZeroDivisionError):
+            p / PolarComplex(0)
+
+    def test_power(self):
+        # Возведение в степень по формуле Муавра
+        p = PolarComplex.from_complex(Complex(1, 1))
+        self.assertEqual(p ** 8, PolarComplex(16, 0))
+        self.assertEqual(p ** -2, PolarComplex(0.5, -math.pi / 2))
+        self.assertEqual(PolarComplex(4, 1) ** Fraction(1, 2), PolarComplex(2, 0.5))
+
+        # Проверка исключений
+        with self.assertRaises(TypeError):
+            p ** "2"
+        with self.assertRaises(ZeroDivisionError):
+            PolarComplex(0) ** -1
+
+    def test_to_complex(self):
+        # Преобразование в Complex
+        z = PolarComplex(2, math.pi / 2).to_complex()
+        self.assertAlmostEqual(float(z.real), 0, places=12)
+        self.assertAlmostEqual(float(z.imag), 2, places=12)
+
+    def test_equality_tolerance(self):
+        # Равенство с допуском и точный режим
+        p = PolarComplex(1, 0)
+        q = PolarComplex(1 + 1e-12, 0)
+        self.assertEqual(p, q)
+        self.assertFalse(p.is_close(q, rel_tol=0))
+        self.assertTrue(PolarComplex(1, math.pi).is_close(PolarComplex(1, -math.pi + 1e-12)))
+        self.assertEqual(PolarComplex(1, 0), 1)
+
+        # Точное сравнение значений, созданных из Complex
+        third = Fraction(1, 3)
+        near = third + Fraction(1, 10 ** 30)
+        exact = PolarComplex.from_complex(Complex(third, 1))
+        self.assertTrue(exact.is_close(PolarComplex.from_complex(Complex(third, 1)), rel_tol=0))
+        self.assertFalse(exact.is_close(PolarComplex.from_complex(Complex(near, 1)), rel_tol=0))
+        self.assertFalse(exact.is_close(Complex(near, 1), rel_tol=0))
+        self.assertTrue(exact.is_close(Complex(near, 1)))
+        self.assertFalse(PolarComplex.from_complex(Complex(third)).is_close(near, rel_tol=0))
+
+    def test_conjugate(self):
+        # Сопряженное число
+        self.assertEqual(PolarComplex(2, 1).conjugate(), PolarComplex(2, -1))
+        self.assertEqual(abs(PolarComplex(2, 1)), 2.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+from fraction_class import Fraction
+from complex import Complex
+from recurrence import linear_recurrence, recurrence_terms
+
+
+def _naive_terms(coefficients, initial, count):
+    # Последовательное вычисление членов по определению
+    terms = list(initial)
+    while len(terms) < count:
+        total = coefficients[0] * terms[-1]
+        for i in range(1, len(coefficients)):
+            total = total + coefficients[i] * terms[-1 - i]
+        terms.append(total)
+    return terms[:count]
+
+
+class TestRecurrence(unittest.TestCase):
+    def test_fibonacci(self):
+        # Числа Фибоначчи с большим номером
+        self.assertEqual(linear_recurrence([1, 1], [0, 1], 0), Fraction(0))
+        self.assertEqual(linear_recurrence([1, 1], [0, 1], 10), Fraction(55))
+        a, b = 0, 1
+        for _ in range(1000):
+            a, b = b, a + b
+        self.assertEqual(linear_recurrence([1, 1], [0, 1], 1000), Fraction(a))
+
+    def test_rational_coefficients(self):
+        # Рекуррентность с дробными коэффициентами и начальными значениями
+        coefficients = [Fraction(1, 2), Fraction(-1, 3), Fraction(2, 7)]
+        initial = [Fraction(1), Fraction(1, 5), Fraction(-3, 4)]
+        expected = _naive_terms(coefficients, initial, 40)
+        for n in (0, 2, 3, 17, 39):
+            self.assertEqual(linear_recurrence(coefficients, initial, n), expected[n])
+        self.assertEqual(recurrence_terms(coefficients, initial, 5, 30), expected[5:35])
+        self.assertEqual(recurrence_terms(coefficients, initial, 0, 2), expected[:2])
+
+        # Смешанные типы входных данных
+        self.assertEqual(linear_recurrence([0.5], [3], 4), Fraction(3, 16))
+
+    def test_complex_coefficients(self):
+        # Рекуррентность с комплексными коэффициентами
+        coefficients = [Complex(Fraction(1, 2), 1), Complex(0, Fraction(-1, 3))]
+        initial = [Complex(1), Complex(0, 1)]
+        expected = _naive_terms(coefficients, initial, 25)
+        self.assertEqual(linear_recurrence(coefficients, initial, 24), expected[24])
+        self.assertEqual(recurrence_terms(coefficients, initial, 3, 10), expected[3:13])
+
+    def test_errors(self):
+        # Проверка исключений для неверных аргументов
+        with self.assertRaises(ValueError):
+            linear_recurrence([1, 1], [0], 5)
+        with self.assertRaises(ValueError):
+            linear_recurrence([], [], 5)
+        with self.assertRaises(ValueError):
+            linear_recurrence([1], [1], -1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+import unittest
+from fraction_class import Fraction
+from complex import Complex
+from stream_stats import StreamStats
+
+
+class TestStreamStats(unittest.TestCase):
+    def test_real_statistics(self):
+        # Среднее, дисперсия, минимум и максимум по генератору значений
+        values = [Fraction(k, k + 2) for k in range(1, 200)]
+        stats = StreamStats().update(value for value in values)
+        n = len(values)
+        mean = sum(values[1:], values[0]) / n
+        squares = [(value - mean) * (value - mean) for value in values]
+        self.assertEqual(stats.count, n)
+        self.assertEqual(stats.mean(), mean)
+        self.assertEqual(stats.variance(), sum(squares[1:], squares[0]) / n)
+        self.assertEqual(stats.variance(ddof=1), sum(squares[1:], squares[0]) / (n - 1))
+        self.assertEqual(stats.minimum(), Fraction(1, 3))
+        self.assertEqual(stats.maximum(), Fraction(199, 201))
+
+        # Смешанные типы входных данных
+        stats = StreamStats().update([1, 0.5, Fraction(3, 2)])
+        self.assertEqual(stats.total(), Fraction(3))
+
+        # Проверка исключения для пустого агрегатора
+        with self.assertRaises(ValueError):
+            StreamStats().mean()
+
+    def test_stored_values_are_copies(self):
+        # Изменение исходного объекта на месте не влияет на минимум
+        value = Fraction(1, 2)
+        stats = StreamStats().update([value, Fraction(3, 4)])
+        value += 5
+        self.assertEqual(stats.minimum(), Fraction(1, 2))
+
+    def test_complex_statistics(self):
+        # Среднее и дисперсия по квадрату модуля
+        stats = StreamStats().update([Complex(1, 1), Complex(Fraction(1, 3), -1), Complex(0, 2)])
+        self.assertEqual(stats.mean(), Complex(Fraction(4, 9), Fraction(2, 3)))
+        # Σ|z|² = 2 + 10/9 + 4, |Σz|² / n = (16/9 + 4) / 3
+        expected = (Fraction(64, 9) - Fraction(52, 27)) / 3
+        self.assertEqual(stats.variance(), expected)
+
+        # Минимум не определён для комплексных значений
+        with self.assertRaises(TypeError):
+            stats.minimum()
+
+    def test_merge(self):
+        # Объединение агрегатов по шардам совпадает с общим агрегатом
+        values = [Fraction(k * k, 7 + k) for k in range(100)]
+        edges = [Fraction(1), Fraction(10), Fraction(50)]
+        whole = StreamStats(edges).update(values)
+        left = StreamStats(edges).update(values[:37])
+        right = StreamStats(edges).update(values[37:])
+        left.merge(right)
+        self.assertEqual(left.count, whole.count)
+        self.assertEqual(left.mean(), whole.mean())
+        self.assertEqual(left.variance(), whole.variance())
+        self.assertEqual(left.minimum(), whole.minimum())
+        self.assertEqual(left.maximum(), whole.maximum())
+        self.assertEqual(left.histogram(), whole.histogram())
+
+        # Проверка исключения при различных границах
+        with self.assertRaises(ValueError):
+            left.merge(StreamStats())
+
+    def test_histogram(self):
+        # Значения на границе попадают в правый интервал
+        stats = StreamStats([0, Fraction(1, 2), 1]).update([-1, 0, Fraction(1, 4), Fraction(1, 2), 2])
+        self.assertEqual(stats.histogram(), [1, 2, 1, 1])
+
+        # Проверка исключений
+        with self.assertRaises(ValueError):
+            StreamStats([1, 0])
+        with self.assertRaises(TypeError):
+            stats.add(Complex(0, 1))
+        with self.assertRaises(ValueError):
+            StreamStats().histogram()
+
+
+if __name__ == "__main__":
+    unittest.main()
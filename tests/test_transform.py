@@ -0,0 +1,65 @@
+import unittest
+import cmath
+from fraction_class import Fraction
+from complex import Complex
+from transform import fft, ifft, ntt, intt, convolve
+
+
+class TestTransform(unittest.TestCase):
+    def test_fft_exact_points(self):
+        # Преобразование дельта-функций на длине 4 точное
+        self.assertEqual(fft([1, 0, 0, 0]), [Complex(1)] * 4)
+        self.assertEqual(fft([0, 1, 0, 0]), [Complex(1), Complex(0, -1), Complex(-1), Complex(0, 1)])
+
+    def test_fft_matches_dft(self):
+        # Сравнение с прямым вычислением ДПФ
+        x = [1, 2, 3, 4, 5, 6, 7, 8]
+        result = fft(x)
+        for k, z in enumerate(result):
+            expected = sum(x[j] * cmath.exp(-2j * cmath.pi * j * k / 8) for j in range(8))
+            self.assertAlmostEqual(float(z.real), expected.real, places=9)
+            self.assertAlmostEqual(float(z.imag), expected.imag, places=9)
+
+        # Обратное преобразование возвращает исходные данные
+        restored = ifft(result)
+        for z, value in zip(restored, x):
+            self.assertAlmostEqual(float(z.real), value, places=9)
+            self.assertAlmostEqual(float(z.imag), 0, places=9)
+
+        # Проверка исключения для длины, не являющейся степенью двойки
+        with self.assertRaises(ValueError):
+            fft([1, 2, 3])
+
+    def test_ntt(self):
+        # Прямое и обратное NTT взаимно обратны
+        values = [5, -3, 7, 0, 1, 2, 9, 4]
+        modulus = 998244353
+        self.assertEqual(intt(ntt(values)), [v % modulus for v in values])
+
+        # Проверка исключения для нецелых элементов
+        with self.assertRaises(TypeError):
+            ntt([Fraction(1, 2), 1])
+
+    def test_convolve_integers(self):
+        # Точная свёртка больших целых чисел
+        a = [10 ** 30, -7, 3]
+        b = [2, 10 ** 20]
+        self.assertEqual(convolve(a, b), [
+            Fraction(2 * 10 ** 30), Fraction(10 ** 50 - 14), Fraction(-7 * 10 ** 20 + 6), Fraction(3 * 10 ** 20)
+        ])
+
+    def test_convolve_fractions(self):
+        # Свёртка дробей
+        result = convolve([Fraction(1, 2), Fraction(1, 3)], [Fraction(2, 5), 1])
+        self.assertEqual(result, [Fraction(1, 5), Fraction(1, 2) + Fraction(2, 15), Fraction(1, 3)])
+
+    def test_convolve_complex(self):
+        # Свёртка гауссовых рациональных чисел
+        a = [Complex(1, 1), Complex(0, Fraction(1, 2))]
+        b = [Complex(2, -1), Complex(Fraction(1, 3))]
+        result = convolve(a, b)
+        self.assertEqual(result, [a[0] * b[0], a[0] * b[1] + a[1] * b[0], a[1] * b[1]])
+
+
+if __name__ == "__main__":
+    unittest.main()
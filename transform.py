@@ -0,0 +1,231 @@
+import math
+from functools import lru_cache
+import int_backend
+from fraction_class import Fraction
+from complex import Complex
+from integer_scaling import as_complex, scale_fractions, scale_complexes
+from number_theory import is_probable_prime, root_of_unity
+
+# Простой модуль по умолчанию для ntt: 119 * 2^23 + 1.
+DEFAULT_MODULUS = 998244353
+
+# Количество хранимых таблиц NTT: convolve подбирает модуль под величину
+# данных, поэтому неограниченный кэш рос бы с каждым новым модулем.
+_NTT_CACHE_SIZE = 32
+
+
+def _check_length(n):
+    """
+    :raises ValueError: Если длина не является степенью двойки.
+    """
+    if n == 0 or n & (n - 1):
+        raise ValueError("Длина последовательности должна быть степенью двойки.")
+
+
+def _bit_reverse(values):
+    """
+    Перестановка элементов в порядке обратных битов индекса.
+    """
+    n = len(values)
+    result = list(values)
+    j = 0
+    for i in range(1, n):
+        bit = n >> 1
+        while j & bit:
+            j ^= bit
+            bit >>= 1
+        j |= bit
+        if i < j:
+            result[i], result[j] = result[j], result[i]
+    return result
+
+
+@lru_cache(maxsize=None)
+def _complex_twiddles(n, inverse):
+    """
+    Таблица поворачивающих множителей exp(∓2πik/n), k = 0 .. n/2 - 1.
+
+    Значения в точках, кратных четверти оборота, задаются точно, остальные
+    вычисляются через Complex.exp. Таблица кэшируется для каждого размера.
+    """
+    sign = 1 if inverse else -1
+    table = []
+    for k in range(n // 2):
+        if 4 * k % n == 0:
+            quarter = 4 * k // n
+            table.append((Complex(1), Complex(0, sign))[quarter])
+        else:
+            table.append(Complex(0, sign * 2 * math.pi * k / n).exp())
+    return tuple(table)
+
+
+def fft(values, inverse=False):
+    """
+    Итеративное быстрое преобразование Фурье по основанию 2 над Complex.
+
+    :param values: Последовательность Complex, Fraction, int или float длины 2^k.
+    :param inverse: Выполнить обратное преобразование.
+    :return: Список Complex.
+    :raises ValueError: Если длина не является степенью двойки.
+    """
+    n = len(values)
+    _check_length(n)
+    data = _bit_reverse([as_complex(value) for value in values])
+    twiddles = _complex_twiddles(n, inverse)
+    size = 2
+    while size <= n:
+        half = size // 2
+        step = n // size
+        for start in range(0, n, size):
+            for k in range(half):
+                u = data[start + k]
+                v = data[start + k + half]
+                if k:
+                    v = v * twiddles[k * step]
+                data[start + k] = u + v
+                data[start + k + half] = u - v
+        size *= 2
+    if inverse:
+        return [z / n for z in data]
+    return data
+
+
+def ifft(values):
+    """
+    Обратное быстрое преобразование Фурье над Complex.
+
+    :param values: Последовательность длины 2^k.
+    :return: Список Complex.
+    """
+    return fft(values, inverse=True)
+
+
+@lru_cache(maxsize=_NTT_CACHE_SIZE)
+def _ntt_twiddles(n, modulus, inverse):
+    """
+    Таблица степеней корня из единицы порядка n по модулю; кэшируются
+    последние _NTT_CACHE_SIZE таблиц.
+    """
+    cofactor, remainder = divmod(modulus - 1, n)
+    if remainder:
+        raise ValueError("Модуль не поддерживает преобразование такой длины.")
+    root = root_of_unity(modulus, n, cofactor)
+    if inverse:
+        root = pow(root, -1, modulus)
+    table = [1] * (n // 2)
+    for k in range(1, n // 2):
+        table[k] = table[k - 1] * root % modulus
+    return tuple(table)
+
+
+def ntt(values, modulus=DEFAULT_MODULUS, inverse=False):
+    """
+    Теоретико-числовое преобразование (NTT) целочисленной последовательности.
+
+    :param values: Последовательность целых чисел длины 2^k.
+    :param modulus: Простой модуль, у которого modulus - 1 делится на длину.
+    :param inverse: Выполнить обратное преобразование.
+    :return: Список вычетов по модулю.
+    :raises TypeError: Если элементы не являются целыми числами.
+    :raises ValueError: Если длина не является степенью двойки или не подходит модулю.
+    """
+    n = len(values)
+    _check_length(n)
+    if not all(isinstance(value, int_backend.INTEGER_TYPES) for value in values):
+        raise TypeError("Элементы должны быть целыми числами.")
+    data = _bit_reverse([value % modulus for value in values])
+    twiddles = _ntt_twiddles(n, modulus, inverse)
+    size = 2
+    while size <= n:
+        half = size // 2
+        step = n // size
+        for start in range(0, n, size):
+            for k in range(half):
+                u = data[start + k]
+                v = data[start + k + half] * twiddles[k * step] % modulus
+                data[start + k] = (u + v) % modulus
+                data[start + k + half] = (u - v) % modulus
+        size *= 2
+    if inverse:
+        n_inverse = pow(n, -1, modulus)
+        return [value * n_inverse % modulus for value in data]
+    return data
+
+
+def intt(values, modulus=DEFAULT_MODULUS):
+    """
+    Обратное теоретико-числовое преобразование.
+
+    :param values: Последовательность вычетов длины 2^k.
+    :param modulus: Простой модуль.
+    :return: Список вычетов по модулю.
+    """
+    return ntt(values, modulus, inverse=True)
+
+
+@lru_cache(maxsize=None)
+def _ntt_modulus(n, bound_bits):
+    """
+    Подбор простого модуля вида c * n + 1, превосходящего 2^(bound_bits + 1).
+
+    Результат кэшируется для пары (длина, разрядность границы).
+    """
+    cofactor = (1 << (bound_bits + 1)) // n + 1
+    while not is_probable_prime(cofactor * n + 1):
+        cofactor += 1
+    return cofactor * n + 1
+
+
+def _integer_convolve(a, b):
+    """
+    Точная свёртка целочисленных последовательностей через NTT.
+
+    Модуль выбирается так, чтобы вместить любое значение результата со знаком.
+    """
+    length = len(a) + len(b) - 1
+    n = 1 << (length - 1).bit_length()
+    bound = max(map(abs, a)) * max(map(abs, b)) * min(len(a), len(b))
+    modulus = _ntt_modulus(n, bound.bit_length())
+    fa = ntt(a + [0] * (n - len(a)), modulus)
+    fb = ntt(b + [0] * (n - len(b)), modulus)
+    product = intt([x * y % modulus for x, y in zip(fa, fb)], modulus)
+    half = modulus // 2
+    return [value - modulus if value > half else value for value in product[:length]]
+
+
+def convolve(a, b):
+    """
+    Точная линейная свёртка последовательностей за O(n log n).
+
+    Для целых и дробных данных используется NTT по подобранному простому
+    модулю; гауссовы рациональные (Complex) данные сводятся к трём
+    целочисленным свёрткам. Результат не содержит ошибок округления.
+
+    :param a: Последовательность Fraction, int, float или Complex.
+    :param b: Последовательность Fraction, int, float или Complex.
+    :return: Список Fraction (для вещественных данных) или Complex.
+    :raises ValueError: Если одна из последовательностей пуста.
+    """
+    if not a or not b:
+        raise ValueError("Последовательности не должны быть пустыми.")
+    if not any(isinstance(value, Complex) for value in list(a) + list(b)):
+        ints_a, den_a = scale_fractions(a)
+        ints_b, den_b = scale_fractions(b)
+        denominator = den_a * den_b
+        return [Fraction(value, denominator) for value in _integer_convolve(ints_a, ints_b)]
+
+    pairs_a, den_a = scale_complexes(a)
+    pairs_b, den_b = scale_complexes(b)
+    denominator = den_a * den_b
+    re_a, im_a = [re for re, _ in pairs_a], [im for _, im in pairs_a]
+    re_b, im_b = [re for re, _ in pairs_b], [im for _, im in pairs_b]
+    real_product = _integer_convolve(re_a, re_b)
+    imag_product = _integer_convolve(im_a, im_b)
+    mixed = _integer_convolve(
+        [x + y for x, y in zip(re_a, im_a)],
+        [x + y for x, y in zip(re_b, im_b)],
+    )
+    return [
+        Complex(Fraction(rr - ii, denominator), Fraction(m - rr - ii, denominator))
+        for rr, ii, m in zip(real_product, imag_product, mixed)
+    ]